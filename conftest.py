@@ -1,9 +1,13 @@
 """Global fixtures for RCT Power integration."""
 
+from collections.abc import AsyncGenerator, Generator
 from unittest.mock import patch
 
 import pytest
 
+from tests.common import FakeClock
+from tests.simulator import InverterSimulator
+
 pytest_plugins = ("pytest_homeassistant_custom_component",)
 
 
@@ -25,13 +29,13 @@ def skip_notifications_fixture():
         yield
 
 
-# This fixture, when used, will result in calls to async_get_data to return None.
+# This fixture, when used, will result in calls to async_get_data to return no data.
 @pytest.fixture(name="bypass_get_data")
 def bypass_get_data_fixture():
     """Skip calls to get data from API."""
     with patch(
         "custom_components.rct_power.RctPowerApiClient.async_get_data",
-        return_value=None,
+        return_value={},
     ):
         yield
 
@@ -46,3 +50,31 @@ def error_get_data_fixture():
         side_effect=Exception,
     ):
         yield
+
+
+# This fixture runs a local stand-in inverter, so the real network path of the API client
+# can be exercised. Tests can change its fault injection settings while it is running.
+@pytest.fixture(name="inverter_simulator")
+async def inverter_simulator_fixture(
+    socket_enabled: None,
+) -> AsyncGenerator[InverterSimulator]:
+    """Run a local inverter simulator for the duration of a test."""
+    simulator = InverterSimulator()
+    await simulator.async_start()
+    yield simulator
+    await simulator.async_stop()
+
+
+# This fixture replaces the monotonic clock used for poll due times and state heartbeats, so
+# tests can advance it without waiting.
+@pytest.fixture(name="clock")
+def clock_fixture() -> Generator[FakeClock]:
+    """Control the monotonic clock of the integration."""
+    clock = FakeClock()
+    with (
+        patch("custom_components.rct_power.coordinator.monotonic", clock),
+        patch("custom_components.rct_power.diagnostics.monotonic", clock),
+        patch("custom_components.rct_power.lib.api.monotonic", clock),
+        patch("custom_components.rct_power.lib.entity.monotonic", clock),
+    ):
+        yield clock
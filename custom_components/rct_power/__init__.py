@@ -7,27 +7,40 @@ https://github.com/weltenwort/home-assistant-rct-power-integration
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from dataclasses import dataclass
+from functools import cache
 from typing import cast
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.util.hass_dict import HassEntryKey
 
+from .capabilities import RctPowerCapabilityStore
 from .const import (
     CONF_HOSTNAME,
+    DEFAULT_ADAPTIVE_CURRENT_RATE_THRESHOLD,
+    DEFAULT_ADAPTIVE_MAX_SCAN_INTERVAL,
+    DEFAULT_ADAPTIVE_MIN_SCAN_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_ADAPTIVE_POWER_RATE_THRESHOLD,
     DOMAIN,
     PLATFORMS,
+    ConfAdaptivePolling,
     ConfScanInterval,
     EntityUpdatePriority,
     ScanIntervalDefault,
 )
-from .coordinator import RctPowerDataUpdateCoordinator
-from .lib.api import RctPowerApiClient
-from .lib.entities import all_entity_descriptions
-from .lib.entity import resolve_object_infos
+from .coordinator import RctPowerDataUpdateCoordinator, RctPowerPollScheduler
+from .lib.adaptive_polling import AdaptivePollInterval
+from .lib.api import RctPowerApiClient, get_object_info_by_name
+from .lib.device_info_helpers import DEVICE_INFO_OBJECT_NAMES
+from .lib.entities import get_all_entity_descriptions
+from .lib.entity import get_entity_unique_id, resolve_object_infos
 from .models import RctConfEntryData, RctConfEntryOptions
+from .snapshot import RctPowerSnapshotStore
 
 RCT_DATA_KEY: HassEntryKey[RctData] = HassEntryKey(DOMAIN)
 
@@ -36,19 +49,78 @@ type RctConfigEntry = ConfigEntry[RctData]
 
 @dataclass
 class RctData:
+    client: RctPowerApiClient
+    scheduler: RctPowerPollScheduler
     update_coordinators: dict[EntityUpdatePriority, RctPowerDataUpdateCoordinator]
+    # objects the inverter doesn't answer, whose entities are skipped
+    unsupported_object_ids: frozenset[int] = frozenset()
+    snapshot_store: RctPowerSnapshotStore | None = None
 
 
-def object_ids_for_update_priority(update_priority: EntityUpdatePriority) -> list[int]:
+def object_ids_for_update_priority(
+    update_priority: EntityUpdatePriority,
+    excluded_object_ids: Collection[int] = (),
+) -> list[int]:
     """Collect all object_ids for an update_priority."""
-    return list(
-        {
+    return [
+        object_id
+        for object_id in get_poll_plan()[update_priority]
+        if object_id not in excluded_object_ids
+    ]
+
+
+@cache
+def get_poll_plan() -> dict[EntityUpdatePriority, list[int]]:
+    """Collect the object_ids of all update_priorities in a single pass."""
+    object_ids: dict[EntityUpdatePriority, dict[int, None]] = {
+        update_priority: {} for update_priority in EntityUpdatePriority
+    }
+
+    # dicts keep the order of the descriptions, unlike sets
+    for entity_description in get_all_entity_descriptions():
+        priority_object_ids = object_ids[entity_description.update_priority]
+
+        for object_info in resolve_object_infos(entity_description):
+            priority_object_ids[object_info.object_id] = None
+
+    return {
+        update_priority: list(priority_object_ids)
+        for update_priority, priority_object_ids in object_ids.items()
+    }
+
+
+def get_disabled_object_ids(
+    hass: HomeAssistant, entry: RctConfigEntry, pinned_object_ids: Collection[int]
+) -> set[int]:
+    """Collect the object_ids that only disabled entities depend on."""
+    disabled_unique_ids = {
+        entity_entry.unique_id
+        for entity_entry in er.async_entries_for_config_entry(
+            er.async_get(hass), entry.entry_id
+        )
+        if entity_entry.disabled
+    }
+    enabled_object_ids = set(pinned_object_ids)
+    disabled_object_ids: set[int] = set()
+
+    for entity_description in get_all_entity_descriptions():
+        object_ids = (
+            disabled_object_ids
+            if get_entity_unique_id(entry.entry_id, entity_description)
+            in disabled_unique_ids
+            else enabled_object_ids
+        )
+        object_ids.update(
             object_info.object_id
-            for entity_description in all_entity_descriptions
-            if entity_description.update_priority == update_priority
             for object_info in resolve_object_infos(entity_description)
-        }
-    )
+        )
+
+    return disabled_object_ids - enabled_object_ids
+
+
+@callback
+def is_entity_enabled_change(event_data: er.EventEntityRegistryUpdatedData) -> bool:
+    return event_data["action"] != "update" or "disabled_by" in event_data["changes"]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: RctConfigEntry) -> bool:
@@ -61,49 +133,136 @@ async def async_setup_entry(hass: HomeAssistant, entry: RctConfigEntry) -> bool:
         port=data[CONF_PORT],
     )
 
-    frequent_update_coordinator = RctPowerDataUpdateCoordinator(
-        hass=hass,
-        entry=entry,
-        client=client,
-        name_suffix="frequent",
-        object_ids=object_ids_for_update_priority(EntityUpdatePriority.FREQUENT),
-        update_interval=options.get(
-            ConfScanInterval.FREQUENT, ScanIntervalDefault.FREQUENT
-        ),
+    adaptive_poll_interval = (
+        AdaptivePollInterval(
+            min_interval=options.get(
+                ConfAdaptivePolling.MIN_INTERVAL, DEFAULT_ADAPTIVE_MIN_SCAN_INTERVAL
+            ),
+            max_interval=options.get(
+                ConfAdaptivePolling.MAX_INTERVAL, DEFAULT_ADAPTIVE_MAX_SCAN_INTERVAL
+            ),
+            power_rate_threshold=options.get(
+                ConfAdaptivePolling.POWER_RATE_THRESHOLD,
+                DEFAULT_ADAPTIVE_POWER_RATE_THRESHOLD,
+            ),
+            current_rate_threshold=options.get(
+                ConfAdaptivePolling.CURRENT_RATE_THRESHOLD,
+                DEFAULT_ADAPTIVE_CURRENT_RATE_THRESHOLD,
+            ),
+            interval=options.get(
+                ConfScanInterval.FREQUENT, ScanIntervalDefault.FREQUENT
+            ),
+        )
+        if options.get(ConfAdaptivePolling.ENABLED, DEFAULT_ADAPTIVE_POLLING)
+        else None
     )
 
-    infrequent_update_coordinator = RctPowerDataUpdateCoordinator(
-        hass=hass,
-        entry=entry,
-        client=client,
-        name_suffix="infrequent",
-        object_ids=object_ids_for_update_priority(EntityUpdatePriority.INFREQUENT),
-        update_interval=options.get(
-            ConfScanInterval.INFREQUENT, ScanIntervalDefault.INFREQUENT
-        ),
+    # the entry's unique id is the serial number of the inverter
+    capability_store = (
+        RctPowerCapabilityStore(hass, entry.unique_id)
+        if entry.unique_id is not None
+        else None
+    )
+    capabilities = (
+        await capability_store.async_load() if capability_store is not None else None
+    )
+    unsupported_object_ids = frozenset(
+        capabilities["unsupported_object_ids"] if capabilities is not None else ()
     )
+    snapshot_store = (
+        RctPowerSnapshotStore(hass, entry.unique_id)
+        if entry.unique_id is not None
+        else None
+    )
+
+    # the devices are registered with these objects, and adaptive polling
+    # measures the activity with its objects, so they are always polled
+    device_object_ids = [
+        get_object_info_by_name(object_name).object_id
+        for object_name in DEVICE_INFO_OBJECT_NAMES
+    ]
+    pinned_object_ids = [
+        *device_object_ids,
+        *(adaptive_poll_interval.object_ids if adaptive_poll_interval else []),
+    ]
 
-    static_update_coordinator = RctPowerDataUpdateCoordinator(
+    scheduler = RctPowerPollScheduler(
         hass=hass,
         entry=entry,
         client=client,
-        name_suffix="static",
-        object_ids=object_ids_for_update_priority(EntityUpdatePriority.STATIC),
-        update_interval=options.get(
-            ConfScanInterval.STATIC, ScanIntervalDefault.STATIC
+        object_ids={
+            update_priority: object_ids_for_update_priority(
+                update_priority, unsupported_object_ids
+            )
+            for update_priority in EntityUpdatePriority
+        },
+        update_intervals={
+            EntityUpdatePriority.FREQUENT: options.get(
+                ConfScanInterval.FREQUENT, ScanIntervalDefault.FREQUENT
+            ),
+            EntityUpdatePriority.INFREQUENT: options.get(
+                ConfScanInterval.INFREQUENT, ScanIntervalDefault.INFREQUENT
+            ),
+            EntityUpdatePriority.STATIC: options.get(
+                ConfScanInterval.STATIC, ScanIntervalDefault.STATIC
+            ),
+        },
+        adaptive_poll_interval=adaptive_poll_interval,
+        first_object_ids=device_object_ids,
+        restored_responses=(
+            await snapshot_store.async_load() if snapshot_store is not None else None
         ),
+        disabled_object_ids=get_disabled_object_ids(hass, entry, pinned_object_ids),
     )
 
-    await frequent_update_coordinator.async_config_entry_first_refresh()
-    await infrequent_update_coordinator.async_config_entry_first_refresh()
-    await static_update_coordinator.async_config_entry_first_refresh()
+    @callback
+    def async_handle_entity_registry_updated(
+        event: Event[er.EventEntityRegistryUpdatedData],
+    ) -> None:
+        scheduler.async_set_disabled_object_ids(
+            get_disabled_object_ids(hass, entry, pinned_object_ids)
+        )
+
+    # disabling or enabling entities changes the polled objects right away,
+    # although Home Assistant only adds enabled entities after a reload
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            async_handle_entity_registry_updated,
+            event_filter=is_entity_enabled_change,
+        )
+    )
+
+    # the first batch only reads the objects needed to register the devices,
+    # which isn't necessary if all of them were restored
+    if scheduler.first_object_ids:
+        try:
+            await scheduler.async_config_entry_first_refresh()
+        except BaseException:
+            await client.async_close()
+            raise
+
+    if snapshot_store is not None:
+        entry.async_on_unload(
+            scheduler.async_add_listener(
+                lambda: snapshot_store.async_schedule_save(scheduler.responses)
+            )
+        )
+
+    # the remaining objects are read in one batch while the entities are set up,
+    # which starts right away and so replaces the scheduled refresh
+    entry.async_create_background_task(
+        hass,
+        async_read_remaining_objects(hass, entry, scheduler, capability_store),
+        f"{DOMAIN} {entry.unique_id} first refresh",
+    )
 
     entry.runtime_data = RctData(
-        {
-            EntityUpdatePriority.FREQUENT: frequent_update_coordinator,
-            EntityUpdatePriority.INFREQUENT: infrequent_update_coordinator,
-            EntityUpdatePriority.STATIC: static_update_coordinator,
-        }
+        client=client,
+        scheduler=scheduler,
+        update_coordinators=scheduler.update_coordinators,
+        unsupported_object_ids=unsupported_object_ids,
+        snapshot_store=snapshot_store,
     )
 
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
@@ -112,9 +271,40 @@ async def async_setup_entry(hass: HomeAssistant, entry: RctConfigEntry) -> bool:
     return True
 
 
+async def async_read_remaining_objects(
+    hass: HomeAssistant,
+    entry: RctConfigEntry,
+    scheduler: RctPowerPollScheduler,
+    capability_store: RctPowerCapabilityStore | None,
+) -> None:
+    """Read the objects left out of the first batch and probe the capabilities."""
+    await scheduler.async_refresh()
+
+    if (
+        capability_store is not None
+        and scheduler.last_update_success
+        and await capability_store.async_update(scheduler)
+    ):
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: RctConfigEntry) -> bool:
     """Handle removal of an entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        data = entry.runtime_data
+        await data.client.async_close()
+
+        if data.snapshot_store is not None:
+            await data.snapshot_store.async_close(data.scheduler.responses)
+
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: RctConfigEntry) -> None:
+    """Remove the stored data of the inverter along with the entry."""
+    if entry.unique_id is not None:
+        await RctPowerCapabilityStore(hass, entry.unique_id).async_remove()
+        await RctPowerSnapshotStore(hass, entry.unique_id).async_remove()
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: RctConfigEntry) -> None:
@@ -0,0 +1,163 @@
+"""Persist which objects an inverter doesn't answer, to neither poll nor show them."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, NotRequired, TypedDict
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, LOGGER
+from .lib.api import (
+    InvalidApiResponse,
+    get_object_info_by_name,
+    get_valid_response_value_or,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import RctPowerPollScheduler
+
+STORAGE_VERSION = 1
+# batches that read the timed out objects again before they're stored, as
+# dropped requests might time out a few times in a row
+PROBE_ATTEMPTS = 3
+# above this share of timed out objects the connection is to blame, not the
+# objects, so nothing is stored
+MAX_TIMED_OUT_SHARE = 0.5
+# objects are probed again after this age, as a probe might still be wrong
+MAX_PROBE_AGE = timedelta(days=7)
+
+
+class InverterCapabilities(TypedDict):
+    # the firmware version the objects were probed with
+    svnversion: str
+    unsupported_object_ids: list[int]
+    # timestamp of the probe, missing in capabilities probed by older versions
+    probe_time: NotRequired[float]
+
+
+class RctPowerCapabilityStore:
+    """Store the capabilities of an inverter in Home Assistant's storage.
+
+    Only the unsupported objects are stored, so objects added to the
+    integration later are polled until a new probe says otherwise.
+    """
+
+    def __init__(self, hass: HomeAssistant, inverter_sn: str) -> None:
+        self._store = Store[InverterCapabilities](
+            hass, STORAGE_VERSION, f"{DOMAIN}.capabilities.{inverter_sn}"
+        )
+        self.capabilities: InverterCapabilities | None = None
+
+    async def async_load(self) -> InverterCapabilities | None:
+        self.capabilities = await self._store.async_load()
+        return self.capabilities
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+        self.capabilities = None
+
+    async def async_update(self, scheduler: RctPowerPollScheduler) -> bool:
+        """Probe the objects unless they were probed recently with the current firmware.
+
+        Returns whether the entry needs to be reloaded, as objects that weren't
+        supported by the previous firmware or probe might be supported now.
+        """
+        svnversion = get_svnversion(scheduler)
+
+        if svnversion is None or (
+            self.capabilities is not None
+            and self.capabilities["svnversion"] == svnversion
+            and not is_probe_expired(self.capabilities)
+        ):
+            return False
+
+        if (
+            self.capabilities is not None
+            and self.capabilities["unsupported_object_ids"]
+        ):
+            # poll all objects again, which are probed after the reload
+            await self.async_remove()
+            return True
+
+        self.capabilities = await self.async_probe(scheduler, svnversion)
+        return False
+
+    async def async_probe(
+        self, scheduler: RctPowerPollScheduler, svnversion: str
+    ) -> InverterCapabilities | None:
+        """Store the objects that time out after the first full read and each retry.
+
+        Nothing is stored if the connection looks to blame for the timeouts,
+        so the objects are probed on the next start instead.
+        """
+        timed_out_object_ids = set(get_timed_out_object_ids(scheduler))
+
+        if len(timed_out_object_ids) > len(scheduler.responses) * MAX_TIMED_OUT_SHARE:
+            LOGGER.debug(
+                "Not probing the objects, as %d of %d timed out",
+                len(timed_out_object_ids),
+                len(scheduler.responses),
+            )
+            return None
+
+        svnversion_object_id = get_object_info_by_name("svnversion").object_id
+
+        for _ in range(PROBE_ATTEMPTS):
+            if not timed_out_object_ids:
+                break
+
+            # the firmware version was answered before, so it's read along
+            # to tell unsupported objects from dropped requests
+            scheduler.async_mark_due([*timed_out_object_ids, svnversion_object_id])
+            await scheduler.async_refresh()
+
+            if not scheduler.last_update_success or get_svnversion(scheduler) is None:
+                return None
+
+            timed_out_object_ids.intersection_update(
+                get_timed_out_object_ids(scheduler)
+            )
+
+        unsupported_object_ids = timed_out_object_ids
+        LOGGER.debug(
+            "Inverter with firmware %s doesn't support objects %s",
+            svnversion,
+            ", ".join(f"{object_id:x}" for object_id in unsupported_object_ids),
+        )
+
+        capabilities = InverterCapabilities(
+            svnversion=svnversion,
+            unsupported_object_ids=sorted(unsupported_object_ids),
+            probe_time=dt_util.utcnow().timestamp(),
+        )
+        await self._store.async_save(capabilities)
+        return capabilities
+
+
+def get_svnversion(scheduler: RctPowerPollScheduler) -> str | None:
+    svnversion = get_valid_response_value_or(
+        scheduler.responses.get(get_object_info_by_name("svnversion").object_id),
+        None,
+    )
+    return svnversion if isinstance(svnversion, str) else None
+
+
+def is_probe_expired(capabilities: InverterCapabilities) -> bool:
+    probe_time = capabilities.get("probe_time")
+
+    return (
+        probe_time is None
+        or dt_util.utcnow().timestamp() - probe_time >= MAX_PROBE_AGE.total_seconds()
+    )
+
+
+def get_timed_out_object_ids(scheduler: RctPowerPollScheduler) -> list[int]:
+    return [
+        object_id
+        for object_id, response in scheduler.responses.items()
+        if isinstance(response, InvalidApiResponse)
+        and response.cause == "OBJECT_READ_TIMEOUT"
+    ]
@@ -0,0 +1,231 @@
+"""Test the probe of the objects an inverter supports."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from rctclient.registry import REGISTRY
+
+from custom_components.rct_power import object_ids_for_update_priority
+from custom_components.rct_power.capabilities import MAX_PROBE_AGE
+from custom_components.rct_power.const import DOMAIN, EntityUpdatePriority
+from custom_components.rct_power.coordinator import RctPowerPollScheduler
+from tests.common import FakeClock, async_setup_simulator_entry
+from tests.simulator import InverterSimulator
+
+INVERTER_SN = "0123456789"
+STORAGE_KEY = f"{DOMAIN}.capabilities.{INVERTER_SN}"
+S0_POWER_OID = REGISTRY.get_by_name("io_board.s0_external_power").object_id
+
+
+def get_s0_power_entity_id(hass: HomeAssistant) -> str | None:
+    return er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"test-{S0_POWER_OID}"
+    )
+
+
+async def test_skip_unsupported_objects(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    clock: FakeClock,
+    inverter_simulator: InverterSimulator,
+) -> None:
+    """Test that objects the inverter doesn't answer are stored and skipped."""
+    inverter_simulator.set_value("inverter_sn", INVERTER_SN)
+    inverter_simulator.set_value("svnversion", "1.0")
+    inverter_simulator.set_supported("io_board.s0_external_power", False)
+
+    setup_time = dt_util.utcnow().timestamp()
+
+    with patch("custom_components.rct_power.lib.api.READ_TIMEOUT", 0.05):
+        config_entry = await async_setup_simulator_entry(
+            hass, inverter_simulator, unique_id=INVERTER_SN
+        )
+
+    # read during the first refresh and once more by each probe attempt
+    assert inverter_simulator.requested_object_ids[S0_POWER_OID] == 4
+    capabilities = hass_storage[STORAGE_KEY]["data"]
+    assert capabilities["svnversion"] == "1.0"
+    assert setup_time <= capabilities["probe_time"] <= dt_util.utcnow().timestamp()
+    assert S0_POWER_OID in capabilities["unsupported_object_ids"]
+    assert get_s0_power_entity_id(hass) is not None
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    er.async_get(hass).async_clear_config_entry(config_entry.entry_id)
+    await hass.async_block_till_done()
+    inverter_simulator.requested_object_ids.clear()
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert S0_POWER_OID not in inverter_simulator.requested_object_ids
+    assert S0_POWER_OID not in config_entry.runtime_data.scheduler.responses
+    assert S0_POWER_OID in config_entry.runtime_data.unsupported_object_ids
+    assert get_s0_power_entity_id(hass) is None
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_probe_again_after_firmware_update(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    clock: FakeClock,
+    inverter_simulator: InverterSimulator,
+) -> None:
+    """Test that a new firmware version polls all objects again."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "svnversion": "1.0",
+            "unsupported_object_ids": [S0_POWER_OID],
+            "probe_time": dt_util.utcnow().timestamp(),
+        },
+    }
+    inverter_simulator.set_value("inverter_sn", INVERTER_SN)
+    inverter_simulator.set_value("svnversion", "1.0")
+
+    config_entry = await async_setup_simulator_entry(
+        hass, inverter_simulator, unique_id=INVERTER_SN
+    )
+    assert S0_POWER_OID not in inverter_simulator.requested_object_ids
+
+    inverter_simulator.set_value("svnversion", "2.0")
+    assert await hass.config_entries.async_reload(config_entry.entry_id)
+    # the entry is reloaded once more to poll all objects
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert inverter_simulator.requested_object_ids[S0_POWER_OID] == 1
+    assert config_entry.runtime_data.unsupported_object_ids == frozenset()
+    capabilities = hass_storage[STORAGE_KEY]["data"]
+    assert capabilities["svnversion"] == "2.0"
+    assert capabilities["unsupported_object_ids"] == []
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_keep_objects_answered_by_a_retry(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    clock: FakeClock,
+    inverter_simulator: InverterSimulator,
+) -> None:
+    """Test that objects timing out only for a while aren't stored."""
+    inverter_simulator.set_value("inverter_sn", INVERTER_SN)
+    inverter_simulator.set_value("svnversion", "1.0")
+    inverter_simulator.set_supported("io_board.s0_external_power", False)
+    inverter_simulator.set_supported("battery.soc", False)
+    async_refresh = RctPowerPollScheduler.async_refresh
+    refreshes = 0
+
+    async def async_refresh_and_recover(scheduler: RctPowerPollScheduler) -> None:
+        nonlocal refreshes
+        await async_refresh(scheduler)
+        refreshes += 1
+
+        # answered again after the full read and the first probe attempt
+        if refreshes == 2:
+            inverter_simulator.set_supported("battery.soc", True)
+
+    with (
+        patch("custom_components.rct_power.lib.api.READ_TIMEOUT", 0.05),
+        patch.object(
+            RctPowerPollScheduler, "async_refresh", new=async_refresh_and_recover
+        ),
+    ):
+        config_entry = await async_setup_simulator_entry(
+            hass, inverter_simulator, unique_id=INVERTER_SN
+        )
+
+    assert hass_storage[STORAGE_KEY]["data"]["unsupported_object_ids"] == [S0_POWER_OID]
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_skip_probe_of_unreliable_connection(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    clock: FakeClock,
+    inverter_simulator: InverterSimulator,
+) -> None:
+    """Test that nothing is stored while most objects time out."""
+    inverter_simulator.set_value("inverter_sn", INVERTER_SN)
+    inverter_simulator.set_value("svnversion", "1.0")
+    for update_priority in (
+        EntityUpdatePriority.FREQUENT,
+        EntityUpdatePriority.INFREQUENT,
+    ):
+        for object_id in object_ids_for_update_priority(update_priority):
+            inverter_simulator.set_supported(REGISTRY.get_by_id(object_id).name, False)
+
+    with patch("custom_components.rct_power.lib.api.READ_TIMEOUT", 0.05):
+        config_entry = await async_setup_simulator_entry(
+            hass, inverter_simulator, unique_id=INVERTER_SN
+        )
+
+    assert inverter_simulator.requested_object_ids[S0_POWER_OID] == 1
+    assert STORAGE_KEY not in hass_storage
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_probe_again_after_max_age(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    clock: FakeClock,
+    inverter_simulator: InverterSimulator,
+) -> None:
+    """Test that objects stored as unsupported are probed again eventually."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "svnversion": "1.0",
+            "unsupported_object_ids": [S0_POWER_OID],
+            "probe_time": (dt_util.utcnow() - MAX_PROBE_AGE).timestamp(),
+        },
+    }
+    inverter_simulator.set_value("inverter_sn", INVERTER_SN)
+    inverter_simulator.set_value("svnversion", "1.0")
+
+    config_entry = await async_setup_simulator_entry(
+        hass, inverter_simulator, unique_id=INVERTER_SN
+    )
+    # the entry is reloaded to poll all objects
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert inverter_simulator.requested_object_ids[S0_POWER_OID] == 1
+    assert config_entry.runtime_data.unsupported_object_ids == frozenset()
+    assert hass_storage[STORAGE_KEY]["data"]["unsupported_object_ids"] == []
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_remove_capabilities_with_entry(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    clock: FakeClock,
+    inverter_simulator: InverterSimulator,
+) -> None:
+    """Test that the capabilities are removed along with the entry."""
+    inverter_simulator.set_value("inverter_sn", INVERTER_SN)
+    inverter_simulator.set_value("svnversion", "1.0")
+
+    config_entry = await async_setup_simulator_entry(
+        hass, inverter_simulator, unique_id=INVERTER_SN
+    )
+    assert STORAGE_KEY in hass_storage
+
+    await hass.config_entries.async_remove(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert STORAGE_KEY not in hass_storage
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from typing import Any
 
 import homeassistant.helpers.config_validation as cv
@@ -10,17 +11,29 @@ from homeassistant import config_entries
 from homeassistant.config_entries import ConfigEntry, ConfigFlowResult
 from homeassistant.const import CONF_PORT
 from homeassistant.core import callback
+from homeassistant.helpers import selector
 
 from .const import (
+    CONF_DEADBANDS,
     CONF_ENTITY_PREFIX,
     CONF_HOSTNAME,
+    CONF_STATE_HEARTBEAT_INTERVAL,
+    DEFAULT_ADAPTIVE_CURRENT_RATE_THRESHOLD,
+    DEFAULT_ADAPTIVE_MAX_SCAN_INTERVAL,
+    DEFAULT_ADAPTIVE_MIN_SCAN_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_ADAPTIVE_POWER_RATE_THRESHOLD,
     DEFAULT_ENTITY_PREFIX,
     DEFAULT_PORT,
+    DEFAULT_STATE_HEARTBEAT_INTERVAL,
     DOMAIN,
+    ConfAdaptivePolling,
     ConfScanInterval,
     ScanIntervalDefault,
 )
 from .lib.api import RctPowerApiClient
+from .lib.entities import get_all_entity_descriptions
+from .lib.entity import RctPowerSensorEntityDescription
 
 
 class RctPowerFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -40,7 +53,10 @@ class RctPowerFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 hostname=user_input[CONF_HOSTNAME],
                 port=user_input[CONF_PORT],
             )
-            serial_number = await client.get_serial_number()
+            try:
+                serial_number = await client.get_serial_number()
+            finally:
+                await client.async_close()
 
             if serial_number is not None:
                 await self.async_set_unique_id(serial_number)
@@ -82,14 +98,36 @@ class RctPowerOptionsFlowHandler(config_entries.OptionsFlow):
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
+        errors: dict[str, str] = {}
+
         if user_input is not None:
-            return self.async_create_entry(data=user_input)
+            try:
+                user_input[CONF_DEADBANDS] = get_deadbands_schema()(
+                    user_input.get(CONF_DEADBANDS, {})
+                )
+            except vol.Invalid:
+                errors[CONF_DEADBANDS] = "invalid_deadbands"
+
+            if user_input.get(
+                ConfAdaptivePolling.MIN_INTERVAL.value,
+                DEFAULT_ADAPTIVE_MIN_SCAN_INTERVAL,
+            ) > user_input.get(
+                ConfAdaptivePolling.MAX_INTERVAL.value,
+                DEFAULT_ADAPTIVE_MAX_SCAN_INTERVAL,
+            ):
+                errors[ConfAdaptivePolling.MIN_INTERVAL.value] = (
+                    "invalid_adaptive_intervals"
+                )
+
+            if not errors:
+                return self.async_create_entry(data=user_input)
 
         return self.async_show_form(
             step_id="user",
             data_schema=self.add_suggested_values_to_schema(
-                OPTIONS_SCHEMA, self.config_entry.options
+                OPTIONS_SCHEMA, user_input or self.config_entry.options
             ),
+            errors=errors,
         )
 
 
@@ -113,5 +151,52 @@ OPTIONS_SCHEMA = vol.Schema(
         vol.Optional(
             ConfScanInterval.STATIC.value, default=ScanIntervalDefault.STATIC
         ): cv.positive_int,
+        vol.Optional(
+            CONF_STATE_HEARTBEAT_INTERVAL, default=DEFAULT_STATE_HEARTBEAT_INTERVAL
+        ): cv.positive_int,
+        # the registering decorator hides the config type of the selector
+        vol.Optional(CONF_DEADBANDS, default={}): selector.ObjectSelector(),  # pyright: ignore [reportUnknownMemberType]
+        vol.Optional(
+            ConfAdaptivePolling.ENABLED.value, default=DEFAULT_ADAPTIVE_POLLING
+        ): bool,
+        vol.Optional(
+            ConfAdaptivePolling.MIN_INTERVAL.value,
+            default=DEFAULT_ADAPTIVE_MIN_SCAN_INTERVAL,
+        ): cv.positive_int,
+        vol.Optional(
+            ConfAdaptivePolling.MAX_INTERVAL.value,
+            default=DEFAULT_ADAPTIVE_MAX_SCAN_INTERVAL,
+        ): cv.positive_int,
+        vol.Optional(
+            ConfAdaptivePolling.POWER_RATE_THRESHOLD.value,
+            default=DEFAULT_ADAPTIVE_POWER_RATE_THRESHOLD,
+        ): cv.positive_float,
+        vol.Optional(
+            ConfAdaptivePolling.CURRENT_RATE_THRESHOLD.value,
+            default=DEFAULT_ADAPTIVE_CURRENT_RATE_THRESHOLD,
+        ): cv.positive_float,
     }
 )
+
+
+@cache
+def get_deadbands_schema() -> vol.Schema:
+    return vol.Schema(
+        {
+            vol.In(
+                [
+                    entity_description.key
+                    for entity_description in get_all_entity_descriptions()
+                    if isinstance(entity_description, RctPowerSensorEntityDescription)
+                ]
+            ): {
+                vol.Optional("absolute"): vol.Any(
+                    None, vol.All(vol.Coerce(float), vol.Range(min=0))
+                ),
+                vol.Optional("relative"): vol.Any(
+                    None, vol.All(vol.Coerce(float), vol.Range(min=0))
+                ),
+                vol.Optional("max_silence"): cv.positive_int,
+            }
+        }
+    )
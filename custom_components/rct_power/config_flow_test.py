@@ -0,0 +1,47 @@
+"""Test the options flow of RCT Power."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.rct_power.const import ConfAdaptivePolling
+from tests.common import FakeClock, async_setup_simulator_entry
+from tests.simulator import InverterSimulator
+
+
+async def test_reject_inverted_adaptive_intervals(
+    hass: HomeAssistant, clock: FakeClock, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that the minimum adaptive interval can't exceed the maximum one."""
+    config_entry = await async_setup_simulator_entry(hass, inverter_simulator)
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(  # pyright: ignore [reportUnknownMemberType]
+        result["flow_id"],
+        user_input={
+            ConfAdaptivePolling.MIN_INTERVAL.value: 60,
+            ConfAdaptivePolling.MAX_INTERVAL.value: 10,
+        },
+    )
+
+    assert result.get("type") is FlowResultType.FORM
+    assert result.get("errors") == {
+        ConfAdaptivePolling.MIN_INTERVAL.value: "invalid_adaptive_intervals"
+    }
+
+    result = await hass.config_entries.options.async_configure(  # pyright: ignore [reportUnknownMemberType]
+        result["flow_id"],
+        user_input={
+            ConfAdaptivePolling.MIN_INTERVAL.value: 10,
+            ConfAdaptivePolling.MAX_INTERVAL.value: 60,
+        },
+    )
+
+    assert result.get("type") is FlowResultType.CREATE_ENTRY
+    assert config_entry.options[ConfAdaptivePolling.MIN_INTERVAL.value] == 10
+    # the entry is reloaded with the new options
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
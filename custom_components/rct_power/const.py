@@ -30,6 +30,12 @@ CONF_HOSTNAME: Final = "hostname"
 DEFAULT_ENTITY_PREFIX: Final = "RCT Power Storage"
 DEFAULT_PORT: Final = 8899
 
+# unchanged states are written again after this many seconds
+CONF_STATE_HEARTBEAT_INTERVAL: Final = "state_heartbeat_interval"
+DEFAULT_STATE_HEARTBEAT_INTERVAL: Final = 60 * 15
+# overrides of the deadbands of sensors by entity description key
+CONF_DEADBANDS: Final = "deadbands"
+
 
 class ConfScanInterval(StrEnum):
     FREQUENT = "frequent_scan_interval"
@@ -41,3 +47,19 @@ class ScanIntervalDefault(IntEnum):
     FREQUENT = 30
     INFREQUENT = 60 * 3
     STATIC = 60 * 60
+
+
+class ConfAdaptivePolling(StrEnum):
+    ENABLED = "adaptive_polling"
+    MIN_INTERVAL = "adaptive_min_scan_interval"
+    MAX_INTERVAL = "adaptive_max_scan_interval"
+    POWER_RATE_THRESHOLD = "adaptive_power_rate_threshold"
+    CURRENT_RATE_THRESHOLD = "adaptive_current_rate_threshold"
+
+
+DEFAULT_ADAPTIVE_POLLING: Final = False
+DEFAULT_ADAPTIVE_MIN_SCAN_INTERVAL: Final = 10
+DEFAULT_ADAPTIVE_MAX_SCAN_INTERVAL: Final = 60 * 2
+# in W/s and A/s
+DEFAULT_ADAPTIVE_POWER_RATE_THRESHOLD: Final = 20.0
+DEFAULT_ADAPTIVE_CURRENT_RATE_THRESHOLD: Final = 0.1
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-from datetime import timedelta
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from time import monotonic
+from types import MappingProxyType
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN, LOGGER, EntityUpdatePriority
+from .lib.adaptive_polling import AdaptivePollInterval
 from .lib.api import (
+    ApiResponse,
     ApiResponseValue,
     InvalidApiResponse,
     RctPowerApiClient,
@@ -15,9 +22,46 @@ from .lib.api import (
     ValidApiResponse,
 )
 
+# objects that become due within this many seconds are polled in the current
+# batch already, so timers that fire slightly early don't cause extra batches
+POLL_COALESCE_WINDOW = 2
+# objects that became due while polling are read right after, but not with an
+# interval of 0, as Home Assistant doesn't schedule refreshes for that
+MIN_UPDATE_INTERVAL = 0.1
 
-class RctPowerDataUpdateCoordinator(DataUpdateCoordinator[RctPowerData]):
-    """Class to manage fetching data from the rct power inverter API."""
+# causes of invalid responses that are specific to an object, like objects not
+# supported by the inverter, with the backoff after the second failure in
+# seconds, which doubles with each further failure
+OBJECT_FAILURE_BACKOFFS = {
+    "OBJECT_READ_TIMEOUT": 60 * 5,
+    "PARSING_ERROR": 60 * 5,
+    "UNKNOWN_ERROR": 60 * 5,
+}
+MAX_OBJECT_FAILURE_BACKOFF = 60 * 60 * 6
+
+
+@dataclass
+class ObjectBackoff:
+    cause: str
+    failures: int
+    # monotonic time at which the object is polled again
+    retry_time: float
+
+
+class RctPowerPollScheduler(DataUpdateCoordinator[RctPowerData]):
+    """Class to poll all objects of a config entry in combined batches.
+
+    Every object is due according to the interval of its update priority, or
+    the adaptive interval for FREQUENT objects if adaptive polling is enabled.
+    On each tick, everything that is due is read in a single batch over the
+    client's connection and published to the per-priority coordinators.
+
+    The first batch only reads the first_object_ids, if given, so the objects
+    needed to set up the entities are known before the remaining ones are read.
+    Restored responses, like those of a snapshot from before a restart, are
+    used until they are as old as the update interval of their objects.
+    Disabled objects, like those of disabled entities, aren't polled at all.
+    """
 
     config_entry: ConfigEntry
 
@@ -27,18 +71,302 @@ class RctPowerDataUpdateCoordinator(DataUpdateCoordinator[RctPowerData]):
         entry: ConfigEntry,
         *,
         client: RctPowerApiClient,
+        object_ids: Mapping[EntityUpdatePriority, list[int]],
+        update_intervals: Mapping[EntityUpdatePriority, int],  # in seconds
+        adaptive_poll_interval: AdaptivePollInterval | None = None,
+        first_object_ids: Collection[int] = (),
+        restored_responses: RctPowerData | None = None,
+        disabled_object_ids: Collection[int] = (),
+    ) -> None:
+        self.client = client
+        self._disabled_object_ids = set(disabled_object_ids)
+        # adapts the interval of the FREQUENT objects, if enabled
+        self.adaptive_poll_interval = adaptive_poll_interval
+        self._adaptive_object_ids = (
+            object_ids.get(EntityUpdatePriority.FREQUENT, [])
+            if adaptive_poll_interval is not None
+            else []
+        )
+        self.last_updated_object_ids: set[int] = set()
+        # objects that failed repeatedly and are only polled occasionally
+        self.object_backoffs: dict[int, ObjectBackoff] = {}
+        # latest response of every object, updated in place after each batch
+        self.responses: RctPowerData = {}
+
+        # the interval of objects shared by multiple priorities is the shortest
+        self._update_intervals: dict[int, float] = {}
+        for update_priority, priority_object_ids in object_ids.items():
+            for object_id in priority_object_ids:
+                self._update_intervals[object_id] = min(
+                    update_intervals[update_priority],
+                    self._update_intervals.get(object_id, float("inf")),
+                )
+        if adaptive_poll_interval is not None:
+            for object_id in self._adaptive_object_ids:
+                self._update_intervals[object_id] = adaptive_poll_interval.interval
+        self._next_poll_times = dict.fromkeys(self._update_intervals, 0.0)
+
+        now = monotonic()
+        for object_id, response in (restored_responses or {}).items():
+            self._restore_response(object_id, response, now)
+
+        # restored objects don't need to be read first, but are read again with
+        # the remaining ones, as they identify the inverter and its firmware
+        self.first_object_ids = [
+            object_id
+            for object_id in first_object_ids
+            if object_id in self._next_poll_times and object_id not in self.responses
+        ]
+        self.async_mark_due(first_object_ids)
+
+        super().__init__(
+            hass=hass,
+            config_entry=entry,
+            logger=LOGGER,
+            name=f"{DOMAIN} {entry.unique_id}",
+            update_interval=timedelta(seconds=min(update_intervals.values())),
+        )
+        self.data = self.responses
+
+        self.update_coordinators = {
+            update_priority: RctPowerDataUpdateCoordinator(
+                hass=hass,
+                entry=entry,
+                scheduler=self,
+                name_suffix=update_priority.name.lower(),
+                object_ids=priority_object_ids,
+            )
+            for update_priority, priority_object_ids in object_ids.items()
+        }
+
+    @property
+    def update_intervals(self) -> Mapping[int, float]:
+        """Return the poll interval of each object in seconds."""
+        return MappingProxyType(self._update_intervals)
+
+    @property
+    def next_poll_times(self) -> Mapping[int, float]:
+        """Return the monotonic time each object is polled next."""
+        return MappingProxyType(self._next_poll_times)
+
+    @property
+    def disabled_object_ids(self) -> frozenset[int]:
+        return frozenset(self._disabled_object_ids)
+
+    @callback
+    def async_mark_due(self, object_ids: Iterable[int]) -> None:
+        """Poll the given objects in the next batch."""
+        for object_id in object_ids:
+            if object_id in self._next_poll_times:
+                self._next_poll_times[object_id] = 0.0
+
+    @callback
+    def async_set_disabled_object_ids(self, object_ids: Collection[int]) -> None:
+        """Stop polling the given objects and poll the others in the next batch."""
+        disabled_object_ids = set(object_ids)
+        self.async_mark_due(self._disabled_object_ids - disabled_object_ids)
+        self._disabled_object_ids = disabled_object_ids
+
+    async def _async_update_data(self) -> RctPowerData:
+        now = monotonic()
+        due_object_ids = (
+            self.first_object_ids
+            if self.first_object_ids
+            else [
+                object_id
+                for object_id, next_poll_time in self._next_poll_times.items()
+                if next_poll_time <= now + POLL_COALESCE_WINDOW
+                and object_id not in self._disabled_object_ids
+            ]
+        )
+        self.last_updated_object_ids = set(due_object_ids)
+
+        try:
+            responses = (
+                await self.client.async_get_data(object_ids=due_object_ids)
+                if due_object_ids
+                else {}
+            )
+        except Exception:
+            # retry as soon as the most frequently polled objects are due again
+            retry_time = now + min(self._update_intervals.values())
+            for object_id in due_object_ids:
+                self._next_poll_times[object_id] = min(
+                    retry_time, now + self._update_intervals[object_id]
+                )
+
+            if self.last_update_success:
+                # the entities of all objects become unavailable
+                self.last_updated_object_ids.update(self._update_intervals)
+            raise
+        else:
+            self.first_object_ids = []
+
+            if not self.last_update_success:
+                # the entities of all objects recover, if their responses are valid
+                self.last_updated_object_ids.update(self._update_intervals)
+
+            if self.adaptive_poll_interval is not None:
+                adaptive_interval = self.adaptive_poll_interval.update(responses, now)
+                for object_id in self._adaptive_object_ids:
+                    self._update_intervals[object_id] = adaptive_interval
+
+            for object_id in due_object_ids:
+                self._next_poll_times[object_id] = self._get_next_poll_time(
+                    object_id, responses.get(object_id), now
+                )
+
+            # responses received without a request, like those to other
+            # clients, postpone the next poll of their objects
+            unsolicited_responses = {
+                object_id: response
+                for object_id, response in (
+                    self.client.pop_unsolicited_responses().items()
+                )
+                if object_id in self._next_poll_times
+            }
+            for object_id in unsolicited_responses:
+                self._next_poll_times[object_id] = (
+                    now + self._update_intervals[object_id]
+                )
+            responses = unsolicited_responses | responses
+            self.last_updated_object_ids.update(unsolicited_responses)
+        finally:
+            # the next tick is scheduled with this interval after returning
+            next_poll_time = min(
+                (
+                    next_poll_time
+                    for object_id, next_poll_time in self._next_poll_times.items()
+                    if object_id not in self._disabled_object_ids
+                ),
+                default=now + max(self._update_intervals.values()),
+            )
+            self.update_interval = timedelta(
+                seconds=max(next_poll_time - monotonic(), MIN_UPDATE_INTERVAL)
+            )
+
+        self.responses.update(responses)
+        return self.responses
+
+    def _restore_response(
+        self, object_id: int, response: ApiResponse, now: float
+    ) -> None:
+        if (
+            object_id not in self._update_intervals
+            or not isinstance(response, ValidApiResponse)
+            or (age := (datetime.now() - response.time).total_seconds()) < 0
+            or age >= self._update_intervals[object_id]
+        ):
+            return
+
+        self.responses[object_id] = response
+        self._next_poll_times[object_id] = now + self._update_intervals[object_id] - age
+
+    def _get_next_poll_time(
+        self, object_id: int, response: ApiResponse | None, now: float
+    ) -> float:
+        next_poll_time = now + self._update_intervals[object_id]
+
+        if (
+            not isinstance(response, InvalidApiResponse)
+            or response.cause not in OBJECT_FAILURE_BACKOFFS
+        ):
+            self.object_backoffs.pop(object_id, None)
+            return next_poll_time
+
+        backoff = self.object_backoffs.get(object_id)
+        failures = (
+            backoff.failures + 1
+            if backoff is not None and backoff.cause == response.cause
+            else 1
+        )
+        # a single failure might be a fluke, so retry in the usual interval
+        delay = (
+            min(
+                OBJECT_FAILURE_BACKOFFS[response.cause] * 2 ** (failures - 2),
+                MAX_OBJECT_FAILURE_BACKOFF,
+            )
+            if failures > 1
+            else 0
+        )
+        retry_time = max(next_poll_time, now + delay)
+
+        if failures > 1:
+            LOGGER.debug(
+                "Backing off from object %x for %ds after %d failures (%s)",
+                object_id,
+                retry_time - now,
+                failures,
+                response.cause,
+            )
+
+        self.object_backoffs[object_id] = ObjectBackoff(
+            cause=response.cause, failures=failures, retry_time=retry_time
+        )
+        return retry_time
+
+
+class RctPowerResponsesView(Mapping[int, ApiResponse]):
+    """Read-only view of the latest responses of some objects.
+
+    It reflects the in-place updates of the underlying responses, so it doesn't
+    need to be copied after each batch.
+    """
+
+    __slots__ = ("_object_ids", "_responses")
+
+    def __init__(self, responses: RctPowerData, object_ids: Iterable[int]) -> None:
+        self._responses = responses
+        self._object_ids = frozenset(object_ids)
+
+    def __getitem__(self, object_id: int) -> ApiResponse:
+        if object_id not in self._object_ids:
+            raise KeyError(object_id)
+        return self._responses[object_id]
+
+    def __iter__(self) -> Iterator[int]:
+        return (
+            object_id for object_id in self._responses if object_id in self._object_ids
+        )
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class RctPowerDataUpdateCoordinator(DataUpdateCoordinator[RctPowerResponsesView]):
+    """Class to provide the data of one update priority to its entities.
+
+    It doesn't poll on its own, but receives the responses of its objects from
+    the RctPowerPollScheduler of its config entry. Listeners can pass the object
+    ids they depend on as context to only be notified when those were updated.
+    """
+
+    config_entry: ConfigEntry
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        *,
+        scheduler: RctPowerPollScheduler,
         name_suffix: str,
         object_ids: list[int],
-        update_interval: int,  # in seconds
     ) -> None:
-        self.client = client
+        self.scheduler = scheduler
         self.object_ids = object_ids
+        self._object_listeners: dict[int, dict[CALLBACK_TYPE, None]] = {
+            object_id: {} for object_id in object_ids
+        }
         super().__init__(
             hass=hass,
             config_entry=entry,
             logger=LOGGER,
             name=f"{DOMAIN} {entry.unique_id} {name_suffix}",
-            update_interval=timedelta(seconds=update_interval),
+        )
+
+        self.data = RctPowerResponsesView(scheduler.responses, object_ids)
+        entry.async_on_unload(
+            scheduler.async_add_listener(self._handle_scheduler_update)
         )
 
     def get_latest_response(
@@ -58,5 +386,62 @@ class RctPowerDataUpdateCoordinator(DataUpdateCoordinator[RctPowerData]):
     def has_valid_value(self, object_id: int) -> bool:
         return isinstance(self.get_latest_response(object_id), ValidApiResponse)
 
-    async def _async_update_data(self) -> RctPowerData:
-        return await self.client.async_get_data(object_ids=self.object_ids)
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for updates of the object ids in context or of all objects."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        object_listeners = [
+            self._object_listeners[object_id]
+            for object_id in (self.object_ids if context is None else context)
+            if object_id in self._object_listeners
+        ]
+
+        for listeners in object_listeners:
+            listeners[update_callback] = None
+
+        @callback
+        def remove_object_listener() -> None:
+            remove_listener()
+
+            for listeners in object_listeners:
+                listeners.pop(update_callback, None)
+
+        return remove_object_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners of the objects updated in the last batch."""
+        update_callbacks: dict[CALLBACK_TYPE, None] = {}
+
+        for object_id in self.scheduler.last_updated_object_ids:
+            if listeners := self._object_listeners.get(object_id):
+                update_callbacks.update(listeners)
+
+        for update_callback in update_callbacks:
+            update_callback()
+
+    async def async_request_refresh(self) -> None:
+        self.scheduler.async_mark_due(self.object_ids)
+        await self.scheduler.async_request_refresh()
+
+    async def async_refresh(self) -> None:
+        self.scheduler.async_mark_due(self.object_ids)
+        await self.scheduler.async_refresh()
+
+    async def _async_update_data(self) -> RctPowerResponsesView:
+        if not self.scheduler.last_update_success:
+            raise UpdateFailed(str(self.scheduler.last_exception))
+
+        return self.data
+
+    @callback
+    def _handle_scheduler_update(self) -> None:
+        if self.scheduler.last_updated_object_ids.isdisjoint(self.object_ids):
+            return
+
+        if self.scheduler.last_update_success:
+            self.async_set_updated_data(self.data)
+        elif isinstance(self.scheduler.last_exception, Exception):
+            self.async_set_update_error(self.scheduler.last_exception)
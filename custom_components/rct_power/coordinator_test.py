@@ -0,0 +1,430 @@
+"""Test the combined polling of all update priorities."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from rctclient.registry import REGISTRY
+
+from custom_components.rct_power import RctConfigEntry, object_ids_for_update_priority
+from custom_components.rct_power.const import (
+    ConfAdaptivePolling,
+    ConfScanInterval,
+    EntityUpdatePriority,
+)
+from custom_components.rct_power.coordinator import RctPowerResponsesView
+from custom_components.rct_power.lib.api import RctPowerData, ValidApiResponse
+from custom_components.rct_power.lib.circuit_breaker import CircuitState
+from custom_components.rct_power.lib.device_info_helpers import (
+    DEVICE_INFO_OBJECT_NAMES,
+)
+from tests.common import FakeClock, async_setup_simulator_entry
+from tests.simulator import InverterSimulator
+
+INVERTER_SN_OID = REGISTRY.get_by_name("inverter_sn").object_id
+BATTERY_SOC_OID = REGISTRY.get_by_name("battery.soc").object_id
+S0_POWER_OID = REGISTRY.get_by_name("io_board.s0_external_power").object_id
+
+
+async def setup_entry(
+    hass: HomeAssistant, inverter_simulator: InverterSimulator
+) -> RctConfigEntry:
+    return await async_setup_simulator_entry(
+        hass,
+        inverter_simulator,
+        options={
+            ConfScanInterval.FREQUENT: 30,
+            ConfScanInterval.INFREQUENT: 90,
+            ConfScanInterval.STATIC: 3600,
+        },
+    )
+
+
+async def test_poll_due_objects_in_combined_batches(
+    hass: HomeAssistant, clock: FakeClock, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that each tick reads everything that is due over one connection."""
+    config_entry = await setup_entry(hass, inverter_simulator)
+    scheduler = config_entry.runtime_data.scheduler
+    frequent_object_ids = set(
+        object_ids_for_update_priority(EntityUpdatePriority.FREQUENT)
+    )
+    infrequent_object_ids = set(
+        object_ids_for_update_priority(EntityUpdatePriority.INFREQUENT)
+    )
+
+    # the first batch reads all objects once
+    assert set(inverter_simulator.requested_object_ids) == set(scheduler.data)
+    assert set(inverter_simulator.requested_object_ids.values()) == {1}
+
+    assert scheduler.update_interval is not None
+    assert scheduler.update_interval.total_seconds() == 30
+
+    clock.time += 30
+    await scheduler.async_refresh()
+    assert scheduler.last_updated_object_ids == frequent_object_ids
+
+    # objects that are due shortly after are read in the same batch
+    clock.time += 59
+    await scheduler.async_refresh()
+    assert scheduler.last_updated_object_ids == (
+        frequent_object_ids | infrequent_object_ids
+    )
+    assert inverter_simulator.connections == 1
+    # the response index is updated in place
+    assert scheduler.data is scheduler.responses
+
+    # each view only holds the responses of its own objects
+    for update_priority, coordinator in scheduler.update_coordinators.items():
+        assert set(coordinator.data) == set(
+            object_ids_for_update_priority(update_priority)
+        )
+        assert all(
+            isinstance(response, ValidApiResponse)
+            for response in coordinator.data.values()
+        )
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_read_device_objects_first(
+    hass: HomeAssistant, clock: FakeClock, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that entities are set up before all objects have been read."""
+    # neither the setup nor the scheduled refresh reads the remaining objects
+    with (
+        patch(
+            "custom_components.rct_power.async_read_remaining_objects",
+            new=AsyncMock(),
+        ),
+        patch("custom_components.rct_power.coordinator.MIN_UPDATE_INTERVAL", 60),
+    ):
+        config_entry = await setup_entry(hass, inverter_simulator)
+    scheduler = config_entry.runtime_data.scheduler
+
+    assert set(inverter_simulator.requested_object_ids) == {
+        REGISTRY.get_by_name(object_name).object_id
+        for object_name in DEVICE_INFO_OBJECT_NAMES
+    }
+    state = hass.states.get("sensor.rct_power_storage_battery_state_of_charge")
+    assert state is not None
+    assert state.state == STATE_UNAVAILABLE
+
+    # the remaining objects fill in with the next batch
+    await scheduler.async_refresh()
+    await hass.async_block_till_done()
+
+    assert BATTERY_SOC_OID in inverter_simulator.requested_object_ids
+    state = hass.states.get("sensor.rct_power_storage_battery_state_of_charge")
+    assert state is not None
+    assert state.state != STATE_UNAVAILABLE
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_skip_objects_of_disabled_entities(
+    hass: HomeAssistant, clock: FakeClock, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that disabling an entity stops polling its objects."""
+    config_entry = await setup_entry(hass, inverter_simulator)
+    scheduler = config_entry.runtime_data.scheduler
+    entity_registry = er.async_get(hass)
+    entity_id = "sensor.rct_power_storage_battery_state_of_charge"
+
+    entity_registry.async_update_entity(
+        entity_id, disabled_by=er.RegistryEntryDisabler.USER
+    )
+    await hass.async_block_till_done()
+
+    clock.time += 30
+    await scheduler.async_refresh()
+    assert BATTERY_SOC_OID not in scheduler.last_updated_object_ids
+    assert scheduler.last_updated_object_ids
+
+    entity_registry.async_update_entity(entity_id, disabled_by=None)
+    await hass.async_block_till_done()
+
+    # enabled objects are polled with the next batch
+    clock.time += 1
+    await scheduler.async_refresh()
+    assert scheduler.last_updated_object_ids == {BATTERY_SOC_OID}
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_schedule_objects_due_during_a_batch(
+    hass: HomeAssistant, clock: FakeClock, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that objects which became due during a slow batch are polled next."""
+    config_entry = await setup_entry(hass, inverter_simulator)
+    scheduler = config_entry.runtime_data.scheduler
+    client = config_entry.runtime_data.client
+    async_get_data = client.async_get_data
+
+    async def async_get_data_slowly(object_ids: list[int]) -> RctPowerData:
+        data = await async_get_data(object_ids)
+        # a static object falls due while the batch is still running
+        clock.time += 3
+        scheduler.async_mark_due([INVERTER_SN_OID])
+        return data
+
+    with patch.object(client, "async_get_data", side_effect=async_get_data_slowly):
+        clock.time += 30
+        await scheduler.async_refresh()
+
+    assert scheduler.update_interval is not None
+    assert scheduler.update_interval.total_seconds() > 0
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert scheduler.last_updated_object_ids == {INVERTER_SN_OID}
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_request_refresh_of_view(
+    hass: HomeAssistant, clock: FakeClock, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that refreshing a view polls its objects through the scheduler."""
+    config_entry = await setup_entry(hass, inverter_simulator)
+    scheduler = config_entry.runtime_data.scheduler
+    static_coordinator = config_entry.runtime_data.update_coordinators[
+        EntityUpdatePriority.STATIC
+    ]
+    inverter_simulator.set_value("inverter_sn", "9876543210")
+
+    await static_coordinator.async_refresh()
+
+    assert scheduler.last_updated_object_ids == set(static_coordinator.object_ids)
+    state = hass.states.get("sensor.rct_power_storage_inverter_serial_number")
+    assert state is not None
+    assert state.state == "9876543210"
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_notify_listeners_of_polled_objects(
+    hass: HomeAssistant, clock: FakeClock, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that listeners are only notified when their objects were polled."""
+    config_entry = await setup_entry(hass, inverter_simulator)
+    scheduler = config_entry.runtime_data.scheduler
+    static_coordinator = config_entry.runtime_data.update_coordinators[
+        EntityUpdatePriority.STATIC
+    ]
+    inverter_sn_listener = Mock()
+    coordinator_listener = Mock()
+    static_coordinator.async_add_listener(
+        inverter_sn_listener, frozenset([INVERTER_SN_OID])
+    )
+    static_coordinator.async_add_listener(coordinator_listener)
+
+    clock.time += 30
+    await scheduler.async_refresh()
+    assert inverter_sn_listener.call_count == 0
+    assert coordinator_listener.call_count == 0
+
+    await static_coordinator.async_refresh()
+    assert inverter_sn_listener.call_count == 1
+    assert coordinator_listener.call_count == 1
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_adapt_frequent_interval_to_activity(
+    hass: HomeAssistant, clock: FakeClock, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that the FREQUENT objects are polled at the adaptive interval."""
+    inverter_simulator.set_value("g_sync.p_ac_sum", 0.0)
+    config_entry = await async_setup_simulator_entry(
+        hass,
+        inverter_simulator,
+        options={
+            ConfScanInterval.FREQUENT: 30,
+            ConfAdaptivePolling.ENABLED: True,
+            ConfAdaptivePolling.MIN_INTERVAL: 10,
+            ConfAdaptivePolling.MAX_INTERVAL: 60,
+        },
+    )
+    scheduler = config_entry.runtime_data.scheduler
+    assert scheduler.update_interval is not None
+    assert scheduler.update_interval.total_seconds() == 30
+
+    inverter_simulator.set_value("g_sync.p_ac_sum", 3000.0)
+    clock.time += 30
+    await scheduler.async_refresh()
+    assert scheduler.update_interval.total_seconds() == 15
+
+    clock.time += 15
+    await scheduler.async_refresh()
+    assert scheduler.update_interval.total_seconds() == 30
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_store_unsolicited_responses(
+    hass: HomeAssistant, clock: FakeClock, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that responses received without a request update their entities."""
+    config_entry = await setup_entry(hass, inverter_simulator)
+    scheduler = config_entry.runtime_data.scheduler
+
+    inverter_simulator.set_value("inverter_sn", "9876543210")
+    inverter_simulator.send_unsolicited("inverter_sn")
+    clock.time += 30
+    await scheduler.async_refresh()
+    await hass.async_block_till_done()
+
+    assert INVERTER_SN_OID in scheduler.last_updated_object_ids
+    state = hass.states.get("sensor.rct_power_storage_inverter_serial_number")
+    assert state is not None
+    assert state.state == "9876543210"
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_back_off_from_failing_objects(
+    hass: HomeAssistant, clock: FakeClock, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that objects which aren't answered are only probed occasionally."""
+    inverter_simulator.set_supported("io_board.s0_external_power", False)
+
+    with patch("custom_components.rct_power.lib.api.READ_TIMEOUT", 0.05):
+        config_entry = await setup_entry(hass, inverter_simulator)
+        scheduler = config_entry.runtime_data.scheduler
+
+        for _ in range(20):
+            clock.time += 30
+            await scheduler.async_refresh()
+
+    # polled during setup, 30s later and then 300s after the second failure
+    assert inverter_simulator.requested_object_ids[S0_POWER_OID] == 3
+    assert inverter_simulator.requested_object_ids[BATTERY_SOC_OID] == 21
+    backoff = scheduler.object_backoffs[S0_POWER_OID]
+    assert backoff.cause == "OBJECT_READ_TIMEOUT"
+    assert backoff.failures == 3
+
+    # a valid response ends the backoff
+    inverter_simulator.set_supported("io_board.s0_external_power", True)
+    clock.time = backoff.retry_time
+    await scheduler.async_refresh()
+    assert S0_POWER_OID not in scheduler.object_backoffs
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_keep_polling_objects_after_silence(
+    hass: HomeAssistant, clock: FakeClock, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that an inverter not answering at all doesn't back off its objects."""
+    config_entry = await setup_entry(hass, inverter_simulator)
+    scheduler = config_entry.runtime_data.scheduler
+    await scheduler.async_refresh()
+    inverter_simulator.drop_rate = 1.0
+
+    with patch("custom_components.rct_power.lib.api.READ_TIMEOUT", 0.05):
+        for _ in range(2):
+            clock.time += 30
+            await scheduler.async_refresh()
+            assert not scheduler.last_update_success
+
+    assert scheduler.object_backoffs == {}
+
+    # all objects due in the meantime are read once it answers again
+    inverter_simulator.drop_rate = 0.0
+    inverter_simulator.requested_object_ids.clear()
+    clock.time += 30
+    await scheduler.async_refresh()
+    assert scheduler.last_update_success
+    assert BATTERY_SOC_OID in inverter_simulator.requested_object_ids
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_fail_fast_while_unreachable(
+    hass: HomeAssistant, clock: FakeClock, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that an unreachable inverter is only probed occasionally."""
+    config_entry = await setup_entry(hass, inverter_simulator)
+    scheduler = config_entry.runtime_data.scheduler
+    client = config_entry.runtime_data.client
+    client.circuit_breaker.probe_backoff = 120
+    await client.async_close()
+
+    with patch(
+        "custom_components.rct_power.lib.api.open_connection",
+        side_effect=ConnectionRefusedError,
+    ) as open_connection:
+        for _ in range(3):
+            clock.time += 30
+            await scheduler.async_refresh()
+            assert not scheduler.last_update_success
+
+        assert open_connection.call_count == 3
+        assert client.circuit_breaker.state is CircuitState.OPEN
+        # including those of objects that weren't due
+        state = hass.states.get("sensor.rct_power_storage_inverter_serial_number")
+        assert state is not None
+        assert state.state == STATE_UNAVAILABLE
+
+        # requests fail without connecting until the probe is due
+        clock.time += 30
+        await scheduler.async_refresh()
+        assert not scheduler.last_update_success
+        assert open_connection.call_count == 3
+        assert str(scheduler.last_exception) == "Inverter unreachable, retrying in 90s"
+
+        clock.time += 90
+        await scheduler.async_refresh()
+        assert open_connection.call_count == 4
+        assert client.circuit_breaker.probe_time == clock.time + 240
+
+    clock.time += 240
+    await scheduler.async_refresh()
+    await hass.async_block_till_done()
+    assert scheduler.last_update_success
+    assert client.circuit_breaker.state is CircuitState.CLOSED
+    state = hass.states.get("sensor.rct_power_storage_inverter_serial_number")
+    assert state is not None
+    assert state.state != STATE_UNAVAILABLE
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+def test_responses_view() -> None:
+    """Test that a view only holds its own objects and follows updates."""
+    time = datetime(2024, 1, 1)
+    responses: RctPowerData = {
+        INVERTER_SN_OID: ValidApiResponse(
+            object_id=INVERTER_SN_OID, time=time, value="0123456789"
+        )
+    }
+    view = RctPowerResponsesView(responses, [BATTERY_SOC_OID])
+
+    assert BATTERY_SOC_OID not in view
+    assert INVERTER_SN_OID not in view
+    assert len(view) == 0
+
+    responses[BATTERY_SOC_OID] = ValidApiResponse(
+        object_id=BATTERY_SOC_OID, time=time, value=0.5
+    )
+
+    assert list(view) == [BATTERY_SOC_OID]
+    assert view[BATTERY_SOC_OID] is responses[BATTERY_SOC_OID]
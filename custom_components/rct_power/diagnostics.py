@@ -0,0 +1,154 @@
+"""Diagnostics support for RCT Power."""
+
+from __future__ import annotations
+
+from time import monotonic
+from typing import Any
+
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.core import HomeAssistant
+from rctclient.registry import REGISTRY
+
+from . import RctConfigEntry
+from .const import CONF_HOSTNAME
+from .coordinator import ObjectBackoff, RctPowerPollScheduler
+from .lib.circuit_breaker import CircuitState
+from .lib.frame_reader import DecodedFrame
+from .lib.poll_metrics import ObjectHealth, PollCycle
+
+TO_REDACT = {CONF_HOSTNAME}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: RctConfigEntry
+) -> dict[str, Any]:
+    """Return the poll statistics of a config entry.
+
+    All of them are kept in memory while polling, so the diagnostics don't
+    depend on debug logging.
+    """
+    data = entry.runtime_data
+    scheduler = data.scheduler
+    metrics = data.client.metrics
+    circuit_breaker = data.client.circuit_breaker
+    disabled_object_ids = scheduler.disabled_object_ids
+    now = monotonic()
+
+    return {
+        "entry": {
+            # the entry data is flat, so it's redacted without async_redact_data,
+            # whose overloads pyright can't resolve
+            "data": {
+                key: REDACTED if key in TO_REDACT else value
+                for key, value in entry.data.items()
+            },
+            "options": dict(entry.options),
+        },
+        "poll_plan": {
+            update_priority.name: [
+                get_object_poll_plan(
+                    scheduler, object_id, object_id in disabled_object_ids, now
+                )
+                for object_id in coordinator.object_ids
+            ]
+            for update_priority, coordinator in data.update_coordinators.items()
+        },
+        "unsupported_objects": sorted(
+            f"{object_id:x}" for object_id in data.unsupported_object_ids
+        ),
+        "circuit_breaker": {
+            "state": circuit_breaker.state,
+            "failures": circuit_breaker.failures,
+            "probe_in": (
+                max(circuit_breaker.probe_time - now, 0)
+                if circuit_breaker.state is not CircuitState.CLOSED
+                else None
+            ),
+        },
+        "cycles": {
+            "count": metrics.cycles,
+            "failed": metrics.failed_cycles,
+            "objects_read": metrics.objects_read,
+            "invalid_responses": dict(metrics.invalid_responses),
+            "recent": [get_cycle_diagnostics(cycle) for cycle in metrics.recent_cycles],
+        },
+        "objects": {
+            f"{object_id:x}": get_object_diagnostics(
+                object_id,
+                metrics.objects.get(object_id),
+                scheduler.object_backoffs.get(object_id),
+                now,
+            )
+            for object_id in sorted(
+                metrics.objects.keys() | scheduler.object_backoffs.keys()
+            )
+        },
+    }
+
+
+def get_cycle_diagnostics(cycle: PollCycle) -> dict[str, Any]:
+    return {
+        "lock_wait_time": cycle.lock_wait_time,
+        "connect_time": cycle.connect_time,
+        "duration": cycle.duration,
+        "objects": cycle.objects,
+        "invalid_responses": dict(cycle.invalid_responses),
+        "error": cycle.error,
+    }
+
+
+def get_object_poll_plan(
+    scheduler: RctPowerPollScheduler, object_id: int, disabled: bool, now: float
+) -> dict[str, Any]:
+    return {
+        "object_id": f"{object_id:x}",
+        "name": REGISTRY.get_by_id(object_id).name,
+        "interval": scheduler.update_intervals.get(object_id),
+        "next_poll_in": max(scheduler.next_poll_times.get(object_id, now) - now, 0),
+        "disabled": disabled,
+    }
+
+
+def get_object_diagnostics(
+    object_id: int,
+    health: ObjectHealth | None,
+    backoff: ObjectBackoff | None,
+    now: float,
+) -> dict[str, Any]:
+    object_name = REGISTRY.get_by_id(object_id).name
+
+    return {
+        "name": object_name,
+        "successes": health.successes if health is not None else 0,
+        "failures": dict(health.failures) if health is not None else {},
+        "last_round_trip_time": (
+            health.last_round_trip_time if health is not None else None
+        ),
+        "last_frame": (
+            get_frame_diagnostics(health.last_frame, object_name)
+            if health is not None and health.last_frame is not None
+            else None
+        ),
+        "backoff": (
+            {
+                "cause": backoff.cause,
+                "failures": backoff.failures,
+                "retry_in": max(backoff.retry_time - now, 0),
+            }
+            if backoff is not None
+            else None
+        ),
+    }
+
+
+def get_frame_diagnostics(frame: DecodedFrame, object_name: str) -> dict[str, Any]:
+    return {
+        "command": frame.command.name,
+        # the payloads of the serial numbers identify the devices
+        "data": REDACTED if is_serial_number(object_name) else frame.data.hex(),
+        "crc_ok": frame.crc_ok,
+    }
+
+
+def is_serial_number(object_name: str) -> bool:
+    return object_name.endswith("_sn") or "_sn[" in object_name
@@ -0,0 +1,80 @@
+"""Test the diagnostics of a config entry."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.core import HomeAssistant
+from rctclient.registry import REGISTRY
+
+from custom_components.rct_power.const import ConfScanInterval
+from custom_components.rct_power.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from tests.common import FakeClock, async_setup_simulator_entry
+from tests.simulator import InverterSimulator
+
+BATTERY_SOC_OID = REGISTRY.get_by_name("battery.soc").object_id
+INVERTER_SN_OID = REGISTRY.get_by_name("inverter_sn").object_id
+S0_POWER_OID = REGISTRY.get_by_name("io_board.s0_external_power").object_id
+
+
+async def test_config_entry_diagnostics(
+    hass: HomeAssistant, clock: FakeClock, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that the diagnostics hold the poll plan and the object health."""
+    inverter_simulator.set_supported("io_board.s0_external_power", False)
+
+    with patch("custom_components.rct_power.lib.api.READ_TIMEOUT", 0.2):
+        config_entry = await async_setup_simulator_entry(
+            hass, inverter_simulator, options={ConfScanInterval.FREQUENT: 30}
+        )
+        scheduler = config_entry.runtime_data.scheduler
+        clock.time += 30
+        await scheduler.async_refresh()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+    # downloaded as JSON
+    json.dumps(diagnostics)
+
+    assert diagnostics["entry"]["data"]["hostname"] == REDACTED
+    frequent_plan = {
+        plan["object_id"]: plan for plan in diagnostics["poll_plan"]["FREQUENT"]
+    }
+    assert frequent_plan[f"{BATTERY_SOC_OID:x}"]["interval"] == 30
+    assert frequent_plan[f"{BATTERY_SOC_OID:x}"]["disabled"] is False
+    assert frequent_plan[f"{BATTERY_SOC_OID:x}"]["next_poll_in"] == 30
+
+    assert diagnostics["circuit_breaker"] == {
+        "state": "closed",
+        "failures": 0,
+        "probe_in": None,
+    }
+
+    cycles = diagnostics["cycles"]
+    assert cycles["count"] == 3
+    assert cycles["failed"] == 0
+    assert len(cycles["recent"]) == 3
+    assert cycles["invalid_responses"] == {"OBJECT_READ_TIMEOUT": 2}
+
+    battery_soc = diagnostics["objects"][f"{BATTERY_SOC_OID:x}"]
+    assert battery_soc["successes"] == 2
+    assert battery_soc["failures"] == {}
+    assert battery_soc["last_frame"]["crc_ok"] is True
+    assert battery_soc["backoff"] is None
+
+    s0_power = diagnostics["objects"][f"{S0_POWER_OID:x}"]
+    assert s0_power["successes"] == 0
+    assert s0_power["failures"] == {"OBJECT_READ_TIMEOUT": 2}
+    assert s0_power["last_frame"] is None
+    assert s0_power["backoff"]["cause"] == "OBJECT_READ_TIMEOUT"
+    assert s0_power["backoff"]["failures"] == 2
+
+    assert diagnostics["objects"][f"{INVERTER_SN_OID:x}"]["last_frame"]["data"] == (
+        REDACTED
+    )
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
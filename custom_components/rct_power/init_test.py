@@ -16,6 +16,7 @@ from custom_components.rct_power.const import (
     DEFAULT_PORT,
     DOMAIN,
 )
+from tests.simulator import InverterSimulator
 
 
 # We can pass fixtures as defined in conftest.py to tell pytest to use the fixture
@@ -69,3 +70,31 @@ async def test_setup_entry_exception(hass: HomeAssistant) -> None:
     # an error.
     with pytest.raises(ConfigEntryNotReady):
         assert await async_setup_entry(hass, config_entry)
+
+
+async def test_setup_entry_with_simulator(
+    hass: HomeAssistant, inverter_simulator: InverterSimulator
+) -> None:
+    """Test entry setup against the local inverter simulator."""
+    inverter_simulator.set_value("inverter_sn", "0123456789")
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_HOSTNAME: inverter_simulator.host,
+            CONF_PORT: inverter_simulator.port,
+            CONF_ENTITY_PREFIX: DEFAULT_ENTITY_PREFIX,
+        },
+        entry_id="test",
+    )
+    config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.rct_power_storage_inverter_serial_number")
+    assert state is not None
+    assert state.state == "0123456789"
+    assert inverter_simulator.connections == 1
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,96 @@
+"""Adapt the poll interval of frequently updated objects to the system activity."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from .api import RctPowerData, ValidApiResponse, get_object_info_by_name
+
+# objects whose rate of change tells how busy the inverter currently is
+ACTIVITY_POWER_OBJECT_NAMES = [
+    "dc_conv.dc_conv_struct[0].p_dc",
+    "dc_conv.dc_conv_struct[1].p_dc",
+    "g_sync.p_ac_sum",
+]
+ACTIVITY_CURRENT_OBJECT_NAMES = [
+    "battery.current",
+]
+
+# the interval shrinks by this factor while the activity exceeds a threshold
+# and grows by it while the activity stays below IDLE_ACTIVITY
+INTERVAL_FACTOR = 2
+IDLE_ACTIVITY = 0.25
+
+
+@dataclass(kw_only=True)
+class AdaptivePollInterval:
+    """Poll faster during rapid changes and back off while the system is idle.
+
+    The activity is the highest rate of change of the activity objects relative
+    to its threshold, so an activity of 1 means one of them changes by exactly
+    its threshold per second.
+    """
+
+    min_interval: float
+    max_interval: float
+    power_rate_threshold: float  # in W/s
+    current_rate_threshold: float  # in A/s
+    interval: float
+    activity: float = 0.0
+
+    _rate_thresholds: dict[int, float] = field(
+        init=False, default_factory=dict[int, float]
+    )
+    # last time and value of each activity object
+    _samples: dict[int, tuple[float, float]] = field(
+        init=False, default_factory=dict[int, tuple[float, float]]
+    )
+
+    def __post_init__(self) -> None:
+        self.interval = min(max(self.interval, self.min_interval), self.max_interval)
+
+        for object_name in ACTIVITY_POWER_OBJECT_NAMES:
+            object_id = get_object_info_by_name(object_name).object_id
+            self._rate_thresholds[object_id] = self.power_rate_threshold
+        for object_name in ACTIVITY_CURRENT_OBJECT_NAMES:
+            object_id = get_object_info_by_name(object_name).object_id
+            self._rate_thresholds[object_id] = self.current_rate_threshold
+
+    @property
+    def object_ids(self) -> list[int]:
+        return list(self._rate_thresholds)
+
+    def update(self, responses: RctPowerData, now: float) -> float:
+        """Adapt the interval to the activity objects in responses."""
+        activities: list[float] = []
+
+        for object_id, rate_threshold in self._rate_thresholds.items():
+            response = responses.get(object_id)
+
+            if not isinstance(response, ValidApiResponse) or not isinstance(
+                response.value, int | float
+            ):
+                continue
+
+            value = float(response.value)
+            previous_sample = self._samples.get(object_id)
+            self._samples[object_id] = (now, value)
+
+            if previous_sample is None or now <= previous_sample[0]:
+                continue
+
+            previous_time, previous_value = previous_sample
+            rate = abs(value - previous_value) / (now - previous_time)
+            activities.append(rate / rate_threshold if rate_threshold > 0 else 0.0)
+
+        if not activities:
+            return self.interval
+
+        self.activity = max(activities)
+
+        if self.activity >= 1:
+            self.interval = max(self.interval / INTERVAL_FACTOR, self.min_interval)
+        elif self.activity < IDLE_ACTIVITY:
+            self.interval = min(self.interval * INTERVAL_FACTOR, self.max_interval)
+
+        return self.interval
@@ -0,0 +1,62 @@
+"""Test the adaptive poll interval."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from rctclient.registry import REGISTRY
+
+from .adaptive_polling import AdaptivePollInterval
+from .api import RctPowerData, ValidApiResponse
+
+P_AC_SUM_OID = REGISTRY.get_by_name("g_sync.p_ac_sum").object_id
+BATTERY_CURRENT_OID = REGISTRY.get_by_name("battery.current").object_id
+
+
+def make_responses(p_ac_sum: float, battery_current: float) -> RctPowerData:
+    return {
+        P_AC_SUM_OID: ValidApiResponse(
+            object_id=P_AC_SUM_OID, time=datetime.now(), value=p_ac_sum
+        ),
+        BATTERY_CURRENT_OID: ValidApiResponse(
+            object_id=BATTERY_CURRENT_OID, time=datetime.now(), value=battery_current
+        ),
+    }
+
+
+def make_adaptive_poll_interval() -> AdaptivePollInterval:
+    return AdaptivePollInterval(
+        min_interval=10,
+        max_interval=120,
+        power_rate_threshold=20,
+        current_rate_threshold=0.1,
+        interval=30,
+    )
+
+
+def test_poll_faster_during_rapid_changes() -> None:
+    """Test that the interval shrinks to the minimum while values change fast."""
+    adaptive_poll_interval = make_adaptive_poll_interval()
+
+    assert adaptive_poll_interval.update(make_responses(0, 0), now=0) == 30
+    # 1000 W in 30 s exceeds 20 W/s
+    assert adaptive_poll_interval.update(make_responses(1000, 0), now=30) == 15
+    # 5 A in 15 s exceeds 0.1 A/s
+    assert adaptive_poll_interval.update(make_responses(1000, 5), now=45) == 10
+    assert adaptive_poll_interval.update(make_responses(2000, 5), now=55) == 10
+
+
+def test_back_off_while_idle() -> None:
+    """Test that the interval grows to the maximum while nothing changes."""
+    adaptive_poll_interval = make_adaptive_poll_interval()
+    now = 0.0
+
+    for _ in range(5):
+        now += adaptive_poll_interval.update(make_responses(100, 1), now=now)
+
+    assert adaptive_poll_interval.interval == 120
+    assert adaptive_poll_interval.activity == 0
+
+    # moderate changes keep the current interval
+    now += 120
+    assert adaptive_poll_interval.update(make_responses(100 + 120 * 10, 1), now) == 120
@@ -3,23 +3,33 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import struct
 from asyncio import StreamReader, StreamWriter, open_connection
 from asyncio.locks import Lock
+from collections import deque
+from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cache
+from time import monotonic
+from typing import NoReturn
 
 from homeassistant.helpers.update_coordinator import UpdateFailed
-from rctclient.exceptions import FrameCRCMismatch, FrameLengthExceeded, InvalidCommand
-from rctclient.frame import ReceiveFrame, SendFrame
-from rctclient.registry import REGISTRY
+from rctclient.frame import SendFrame
+from rctclient.registry import REGISTRY, ObjectInfo
 from rctclient.types import Command, EventEntry
 from rctclient.utils import decode_value
 
 from ..const import LOGGER
+from .circuit_breaker import CircuitBreaker
+from .frame_reader import DecodedFrame, FrameStreamReader
+from .poll_metrics import PollCycle, PollMetrics
 
 CONNECTION_TIMEOUT = 20
 READ_TIMEOUT = 2
+# maximum number of read requests sent ahead of their responses
+PIPELINE_WINDOW_SIZE = 16
 INVERTER_SN_OID = 0x7924ABD9
 
 type ApiResponseValue = (
@@ -33,18 +43,19 @@ type ApiResponseValue = (
 )
 
 
-@dataclass
+# slotted, as every poll creates one of them for each object
+@dataclass(slots=True)
 class BaseApiResponse:
     object_id: int
     time: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidApiResponse(BaseApiResponse):
     value: ApiResponseValue
 
 
-@dataclass
+@dataclass(slots=True)
 class InvalidApiResponse(BaseApiResponse):
     cause: str
 
@@ -62,6 +73,21 @@ def get_valid_response_value_or[_R](
         return defaultValue
 
 
+@cache
+def get_object_infos_by_name() -> dict[str, ObjectInfo]:
+    # the registry itself only supports looking up names by scanning all objects
+    return {object_info.name: object_info for object_info in REGISTRY.all()}
+
+
+def get_object_info_by_name(object_name: str) -> ObjectInfo:
+    return get_object_infos_by_name()[object_name]
+
+
+@cache
+def get_known_object_ids() -> frozenset[int]:
+    return frozenset(object_info.object_id for object_info in REGISTRY.all())
+
+
 class RctPowerApiClient:
     def __init__(self, hostname: str, port: int) -> None:
         """Sample API Client."""
@@ -72,6 +98,23 @@ class RctPowerApiClient:
         # inverter's firmware doesn't handle it well at the time of writing
         self._connection_lock = Lock()
 
+        # the connection is kept open across batches, because the inverter's
+        # firmware is slow to accept new connections
+        self._reader: StreamReader | None = None
+        self._writer: StreamWriter | None = None
+        self._frames: FrameStreamReader | None = None
+
+        # valid responses received for objects that weren't requested, like
+        # answers to other clients, by the time they were received
+        self._unsolicited_responses: RctPowerData = {}
+
+        self.metrics = PollMetrics()
+        # rejects requests while the inverter is unreachable, instead of
+        # letting each of them wait for the connection timeout
+        self.circuit_breaker = CircuitBreaker()
+        # the measurements of the batch in progress
+        self._cycle: PollCycle | None = None
+
     async def get_serial_number(self) -> str | None:
         inverter_data = await self.async_get_data([INVERTER_SN_OID])
 
@@ -85,136 +128,351 @@ class RctPowerApiClient:
             return None
 
     async def async_get_data(self, object_ids: list[int]) -> RctPowerData:
+        circuit_breaker = self.circuit_breaker
+        loop = asyncio.get_running_loop()
+        lock_wait_start = loop.time()
+
+        if circuit_breaker.rejects_request(monotonic()):
+            self._raise_unreachable()
+
         async with self._connection_lock:
-            async with asyncio.timeout(CONNECTION_TIMEOUT):
-                reader, writer = await open_connection(
-                    host=self._hostname, port=self._port
-                )
+            # the probe only starts while holding the lock, so a request
+            # cancelled while waiting for it can't leave the breaker half open,
+            # and the batch before this one might have opened the breaker
+            if not circuit_breaker.allow_request(monotonic()):
+                self._raise_unreachable()
+
+            start = loop.time()
+            self._cycle = cycle = PollCycle(
+                lock_wait_time=start - lock_wait_start, objects=len(object_ids)
+            )
 
-                try:
-                    if reader.at_eof():
-                        raise UpdateFailed("Read stream closed")
+            try:
+                data = await self._async_get_data(object_ids)
+            except Exception as exc:
+                cycle.error = type(exc).__name__
+                circuit_breaker.record_failure(monotonic())
+
+                if circuit_breaker.is_open:
+                    LOGGER.debug(
+                        "Inverter unreachable after %d failed batches, retrying in %ds",
+                        circuit_breaker.failures,
+                        circuit_breaker.probe_time - monotonic(),
+                    )
+                raise
+            except BaseException as exc:
+                cycle.error = type(exc).__name__
+                circuit_breaker.abort_request()
+                raise
+            else:
+                circuit_breaker.record_success()
+
+                for object_id, response in data.items():
+                    health = self.metrics.get_object_health(object_id)
+
+                    if isinstance(response, InvalidApiResponse):
+                        cycle.invalid_responses[response.cause] += 1
+                        health.failures[response.cause] += 1
+                    else:
+                        health.successes += 1
+
+                return data
+            finally:
+                cycle.duration = loop.time() - start
+                self.metrics.record_cycle(cycle)
+                self._cycle = None
+
+    async def _async_get_data(self, object_ids: list[int]) -> RctPowerData:
+        async with asyncio.timeout(CONNECTION_TIMEOUT):
+            try:
+                reader, _ = await self._async_get_connection()
+
+                if reader.at_eof():
+                    raise UpdateFailed("Read stream closed")
+
+                data = await self._read_objects(object_ids)
+            except BaseException:
+                self._close_connection()
+                raise
+
+            if data and all(
+                isinstance(response, InvalidApiResponse)
+                and response.cause == "OBJECT_READ_TIMEOUT"
+                for response in data.values()
+            ):
+                # a connection that doesn't answer at all is likely
+                # stale, so establish a new one for the next batch
+                self._close_connection()
+
+                if any(
+                    (health := self.metrics.objects.get(object_id)) is not None
+                    and health.successes
+                    for object_id in data
+                ):
+                    # objects that were answered before don't all stop being
+                    # supported at once, the inverter stopped answering instead
+                    raise UpdateFailed("Inverter didn't answer any request")
+
+            return data
+
+    def _raise_unreachable(self) -> NoReturn:
+        raise UpdateFailed(
+            "Inverter unreachable, retrying in "
+            f"{max(self.circuit_breaker.probe_time - monotonic(), 0):.0f}s"
+        )
 
-                    return {
-                        object_id: await self._read_object(
-                            reader=reader, writer=writer, object_id=object_id
-                        )
-                        for object_id in object_ids
-                    }
-                finally:
-                    writer.close()
+    def pop_unsolicited_responses(self) -> RctPowerData:
+        """Return and forget the valid responses received without a request."""
+        unsolicited_responses = self._unsolicited_responses
+        self._unsolicited_responses = {}
+        return unsolicited_responses
 
-    async def _read_object(
-        self, reader: StreamReader, writer: StreamWriter, object_id: int
-    ) -> ApiResponse:
-        object_name = REGISTRY.get_by_id(object_id).name
-        read_command_frame = SendFrame(command=Command.READ, id=object_id)
+    async def async_close(self) -> None:
+        async with self._connection_lock:
+            writer = self._writer
+            self._close_connection()
+
+            if writer is not None:
+                with suppress(OSError):
+                    await writer.wait_closed()
+
+    async def _async_get_connection(self) -> tuple[StreamReader, StreamWriter]:
+        if (
+            self._reader is None
+            or self._writer is None
+            or self._reader.at_eof()
+            or self._writer.is_closing()
+        ):
+            self._close_connection()
 
-        LOGGER.debug(
-            "Requesting RCT Power data for object %x (%s)...", object_id, object_name
-        )
-        request_time = datetime.now()
+            LOGGER.debug(
+                "Connecting to RCT Power inverter at %s:%s...",
+                self._hostname,
+                self._port,
+            )
+            loop = asyncio.get_running_loop()
+            connect_start = loop.time()
+            self._reader, self._writer = await open_connection(
+                host=self._hostname, port=self._port
+            )
+            self._frames = FrameStreamReader(self._reader)
+
+            if self._cycle is not None:
+                # a batch might need to reconnect after losing the connection
+                self._cycle.connect_time += loop.time() - connect_start
+
+        return self._reader, self._writer
+
+    async def _async_get_frame_stream(
+        self,
+    ) -> tuple[FrameStreamReader, StreamWriter]:
+        _, writer = await self._async_get_connection()
+        assert self._frames is not None
+
+        return self._frames, writer
+
+    def _close_connection(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+        self._reader = None
+        self._writer = None
+        self._frames = None
+
+    async def _read_objects(self, object_ids: list[int]) -> RctPowerData:
+        """Read a batch of objects with up to PIPELINE_WINDOW_SIZE requests in flight."""
+        loop = asyncio.get_running_loop()
+        frames, writer = await self._async_get_frame_stream()
+        # avoid the name lookups of the debug messages for each object
+        debug_logging = LOGGER.isEnabledFor(logging.DEBUG)
+
+        data: RctPowerData = {}
+        requested_object_ids = set(object_ids)
+        queued_object_ids = deque(dict.fromkeys(object_ids))
+        # request time and loop time of sending the requests in flight
+        pending_requests: dict[int, tuple[datetime, float]] = {}
+        metrics = self.metrics
+        has_reconnected = False
+
+        while queued_object_ids or pending_requests:
+            lost_connection_cause: str | None = None
+            response_frame: DecodedFrame | None = None
+
+            try:
+                while (
+                    queued_object_ids and len(pending_requests) < PIPELINE_WINDOW_SIZE
+                ):
+                    object_id = queued_object_ids.popleft()
+                    if object_id in data:
+                        # already received without a request in this batch
+                        continue
+                    if debug_logging:
+                        LOGGER.debug(
+                            "Requesting RCT Power data for object %x (%s)...",
+                            object_id,
+                            REGISTRY.get_by_id(object_id).name,
+                        )
+                    writer.write(SendFrame(command=Command.READ, id=object_id).data)
+                    pending_requests[object_id] = (datetime.now(), loop.time())
+
+                if not pending_requests:
+                    # the remaining objects were all received without a request
+                    continue
 
-        try:
-            async with asyncio.timeout(READ_TIMEOUT):
                 await writer.drain()
-                writer.write(read_command_frame.data)
-
-                # loop until we return or time out
-                while True:
-                    response_frame = ReceiveFrame()
-
-                    while not response_frame.complete() and not reader.at_eof():
-                        raw_response = await reader.read(1)
-
-                        if len(raw_response) > 0:
-                            response_frame.consume(raw_response)
-
-                    if response_frame.complete():
-                        response_object_info = REGISTRY.get_by_id(response_frame.id)
-                        data_type = response_object_info.response_data_type
-                        received_object_name = response_object_info.name
-
-                        # ignore, if this is not the answer to the latest request
-                        if object_id != response_frame.id:
-                            LOGGER.debug(
-                                "Mismatch of requested and received object ids: requested %x (%s), but received %x (%s)",
-                                object_id,
-                                object_name,
-                                response_frame.id,
-                                received_object_name,
-                            )
-                            continue
-
-                        decoded_value: ApiResponseValue = decode_value(
-                            data_type,  # type: ignore
-                            response_frame.data,
-                        )  # type: ignore
 
+                async with asyncio.timeout_at(
+                    min(sent_time for _, sent_time in pending_requests.values())
+                    + READ_TIMEOUT
+                ):
+                    response_frame = await anext(frames, None)
+
+                if response_frame is None:
+                    lost_connection_cause = "INCOMPLETE"
+            except TimeoutError:
+                now = loop.time()
+
+                for object_id, (request_time, sent_time) in list(
+                    pending_requests.items()
+                ):
+                    if sent_time + READ_TIMEOUT <= now:
+                        del pending_requests[object_id]
                         LOGGER.debug(
-                            "Decoded data for object %x (%s): %s",
-                            response_frame.id,
-                            received_object_name,
-                            decoded_value,
+                            "Error reading object %x (%s): timed out",
+                            object_id,
+                            REGISTRY.get_by_id(object_id).name,
                         )
-
-                        return ValidApiResponse(
+                        data[object_id] = InvalidApiResponse(
                             object_id=object_id,
                             time=request_time,
-                            value=decoded_value,
+                            cause="OBJECT_READ_TIMEOUT",
                         )
-                    else:
-                        LOGGER.debug(
-                            "Error decoding object %x (%s): %s",
-                            object_id,
-                            object_name,
-                            response_frame.data,
+                continue
+            except ConnectionError as exc:
+                LOGGER.debug("Error reading objects: %s", str(exc))
+                lost_connection_cause = "CONNECTION_ERROR"
+
+            if lost_connection_cause is not None:
+                if has_reconnected:
+                    # give up on the remaining objects of this batch
+                    for object_id, (request_time, _) in pending_requests.items():
+                        data[object_id] = InvalidApiResponse(
+                            object_id=object_id,
+                            time=request_time,
+                            cause=lost_connection_cause,
                         )
-                        return InvalidApiResponse(
-                            object_id=object_id, time=request_time, cause="INCOMPLETE"
+                    request_time = datetime.now()
+                    for object_id in queued_object_ids:
+                        data[object_id] = InvalidApiResponse(
+                            object_id=object_id,
+                            time=request_time,
+                            cause=lost_connection_cause,
                         )
+                    break
+
+                # the inverter closed the connection while we were waiting for
+                # responses, so reconnect and request the missing objects again
+                has_reconnected = True
+                queued_object_ids.extendleft(reversed(pending_requests))
+                pending_requests.clear()
+                self._close_connection()
+                frames, writer = await self._async_get_frame_stream()
+                continue
+
+            assert response_frame is not None
+            pending_request = pending_requests.pop(response_frame.id, None)
+
+            if pending_request is None:
+                # not the answer to one of the pending requests, but a late one
+                # or one to another client, so keep its value if it's valid
+                LOGGER.debug(
+                    "Mismatch of requested and received object ids: received %x",
+                    response_frame.id,
+                )
 
-        except TimeoutError as exc:
-            LOGGER.debug(
-                "Error reading object %x (%s): %s", object_id, object_name, str(exc)
-            )
-            return InvalidApiResponse(
-                object_id=object_id,
-                time=request_time,
-                cause="OBJECT_READ_TIMEOUT",
-            )
-        except FrameCRCMismatch as exc:
-            LOGGER.debug(
-                "Error reading object %x (%s): %s", object_id, object_name, str(exc)
+                if (
+                    not response_frame.crc_ok
+                    or response_frame.id not in get_known_object_ids()
+                ):
+                    # a corrupted id or an object rctclient doesn't know, like
+                    # those of the vendor app, so there's nothing to keep
+                    continue
+
+                response = self._decode_response(
+                    response_frame, request_time=datetime.now()
+                )
+
+                if not isinstance(response, ValidApiResponse):
+                    continue
+
+                if response_frame.id in requested_object_ids and not isinstance(
+                    data.get(response_frame.id), ValidApiResponse
+                ):
+                    data[response_frame.id] = response
+                else:
+                    self._unsolicited_responses[response_frame.id] = response
+                continue
+
+            round_trip_time = loop.time() - pending_request[1]
+            metrics.round_trip_times.add(round_trip_time)
+            health = metrics.get_object_health(response_frame.id)
+            health.last_round_trip_time = round_trip_time
+            health.last_frame = response_frame
+            data[response_frame.id] = self._decode_response(
+                response_frame, request_time=pending_request[0]
             )
+
+        return {object_id: data[object_id] for object_id in object_ids}
+
+    def _decode_response(
+        self, response_frame: DecodedFrame, request_time: datetime
+    ) -> ApiResponse:
+        object_id = response_frame.id
+
+        if not response_frame.crc_ok:
+            # the id might be corrupted as well, so don't look it up
+            LOGGER.debug("Error reading object %x: CRC mismatch", object_id)
             return InvalidApiResponse(
                 object_id=object_id, time=request_time, cause="CRC_ERROR"
             )
-        except FrameLengthExceeded as exc:
-            LOGGER.debug(
-                "Error reading object %x (%s): %s", object_id, object_name, str(exc)
-            )
-            return InvalidApiResponse(
-                object_id=object_id, time=request_time, cause="FRAME_LENGTH_EXCEEDED"
-            )
-        except InvalidCommand as exc:
-            LOGGER.debug(
-                "Error reading object %x (%s): %s", object_id, object_name, str(exc)
-            )
-            return InvalidApiResponse(
-                object_id=object_id, time=request_time, cause="INVALID_COMMAND"
-            )
+
+        object_info = REGISTRY.get_by_id(object_id)
+
+        try:
+            decoded_value: ApiResponseValue = decode_value(
+                object_info.response_data_type,  # type: ignore
+                response_frame.data,
+            )  # type: ignore
         except struct.error as exc:
             LOGGER.debug(
-                "Error reading object %x (%s): %s", object_id, object_name, str(exc)
+                "Error decoding object %x (%s): %s",
+                object_id,
+                object_info.name,
+                str(exc),
             )
             return InvalidApiResponse(
                 object_id=object_id, time=request_time, cause="PARSING_ERROR"
             )
         except Exception as exc:
             LOGGER.debug(
-                "Error reading object %x (%s): %s", object_id, object_name, str(exc)
+                "Error decoding object %x (%s): %s",
+                object_id,
+                object_info.name,
+                str(exc),
             )
             return InvalidApiResponse(
                 object_id=object_id, time=request_time, cause="UNKNOWN_ERROR"
             )
+
+        LOGGER.debug(
+            "Decoded data for object %x (%s): %s",
+            object_id,
+            object_info.name,
+            decoded_value,
+        )
+
+        return ValidApiResponse(
+            object_id=object_id,
+            time=request_time,
+            value=decoded_value,
+        )
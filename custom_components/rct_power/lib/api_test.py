@@ -0,0 +1,278 @@
+"""Test the RCT Power API client against a local inverter simulator."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from rctclient.registry import REGISTRY
+
+from custom_components.rct_power import object_ids_for_update_priority
+from custom_components.rct_power.const import EntityUpdatePriority
+from tests.simulator import InverterSimulator, encode_response_frame
+
+from .api import (
+    PIPELINE_WINDOW_SIZE,
+    InvalidApiResponse,
+    RctPowerApiClient,
+    ValidApiResponse,
+    get_object_info_by_name,
+)
+from .circuit_breaker import CircuitState
+
+INVERTER_SN_OID = REGISTRY.get_by_name("inverter_sn").object_id
+BATTERY_SOC_OID = REGISTRY.get_by_name("battery.soc").object_id
+S0_POWER_OID = REGISTRY.get_by_name("io_board.s0_external_power").object_id
+
+
+@pytest.fixture(name="client")
+async def client_fixture(inverter_simulator: InverterSimulator):
+    """Create a client connected to the simulator."""
+    client = RctPowerApiClient(
+        hostname=inverter_simulator.host, port=inverter_simulator.port
+    )
+    yield client
+    await client.async_close()
+
+
+def all_object_ids() -> list[int]:
+    return [
+        object_id
+        for update_priority in EntityUpdatePriority
+        for object_id in object_ids_for_update_priority(update_priority)
+    ]
+
+
+async def test_read_all_entity_objects(
+    client: RctPowerApiClient, inverter_simulator: InverterSimulator
+) -> None:
+    """Test reading every object used by an entity description."""
+    inverter_simulator.set_value("inverter_sn", "0123456789")
+    inverter_simulator.set_value("battery.soc", 0.5)
+    object_ids = all_object_ids()
+
+    data = await client.async_get_data(object_ids)
+
+    assert list(data) == object_ids
+    assert all(isinstance(response, ValidApiResponse) for response in data.values())
+    assert data[INVERTER_SN_OID].value == "0123456789"  # type: ignore
+    assert data[BATTERY_SOC_OID].value == 0.5  # type: ignore
+
+
+async def test_reuse_connection(
+    client: RctPowerApiClient, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that consecutive batches share one connection."""
+    inverter_simulator.max_connections = 1
+
+    for _ in range(3):
+        data = await client.async_get_data([INVERTER_SN_OID, BATTERY_SOC_OID])
+        assert all(isinstance(response, ValidApiResponse) for response in data.values())
+
+    assert inverter_simulator.connections == 1
+    assert inverter_simulator.rejected_connections == 0
+
+
+async def test_reconnect_after_connection_loss(
+    client: RctPowerApiClient, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that a connection closed by the inverter is re-established."""
+    await client.async_get_data([INVERTER_SN_OID])
+    inverter_simulator.disconnect_all()
+
+    data = await client.async_get_data([INVERTER_SN_OID, BATTERY_SOC_OID])
+
+    assert all(isinstance(response, ValidApiResponse) for response in data.values())
+    assert inverter_simulator.connections == 2
+
+
+async def test_close_connection(
+    client: RctPowerApiClient, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that closing the client closes its connection."""
+    await client.async_get_data([INVERTER_SN_OID])
+    assert inverter_simulator.active_connections == 1
+
+    await client.async_close()
+    # give the simulator a chance to notice the closed connection
+    async with asyncio.timeout(0.1):
+        while inverter_simulator.active_connections:
+            await asyncio.sleep(0.01)
+
+
+async def test_pipeline_requests(
+    client: RctPowerApiClient, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that requests don't wait for the previous response."""
+    inverter_simulator.latency = 0.05
+    object_ids = object_ids_for_update_priority(EntityUpdatePriority.FREQUENT)
+
+    start = time.perf_counter()
+    data = await client.async_get_data(object_ids)
+    duration = time.perf_counter() - start
+
+    assert all(isinstance(response, ValidApiResponse) for response in data.values())
+    # one round trip per object would take more than len(object_ids) * 0.05s
+    assert duration < len(object_ids) * inverter_simulator.latency / 4
+
+
+async def test_handle_out_of_order_and_unsolicited_frames(
+    client: RctPowerApiClient, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that responses are matched to their requests by object id."""
+    inverter_simulator.jitter = 0.02
+    inverter_simulator.unsolicited_rate = 1.0
+    inverter_simulator.set_value("inverter_sn", "0123456789")
+    object_ids = all_object_ids()
+
+    data = await client.async_get_data(object_ids)
+
+    assert all(isinstance(response, ValidApiResponse) for response in data.values())
+    assert data[INVERTER_SN_OID].value == "0123456789"  # type: ignore
+
+
+async def test_time_out_unanswered_objects(
+    client: RctPowerApiClient, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that unanswered objects don't fail the rest of the batch."""
+    inverter_simulator.set_supported("io_board.s0_external_power", False)
+
+    with patch("custom_components.rct_power.lib.api.READ_TIMEOUT", 0.1):
+        data = await client.async_get_data(
+            [INVERTER_SN_OID, S0_POWER_OID, BATTERY_SOC_OID]
+        )
+
+    assert isinstance(data[INVERTER_SN_OID], ValidApiResponse)
+    assert isinstance(data[BATTERY_SOC_OID], ValidApiResponse)
+    s0_power_response = data[S0_POWER_OID]
+    assert isinstance(s0_power_response, InvalidApiResponse)
+    assert s0_power_response.cause == "OBJECT_READ_TIMEOUT"
+
+
+async def test_fail_batch_of_silent_inverter(
+    client: RctPowerApiClient, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that an inverter answering no request at all fails the batch."""
+    await client.async_get_data([INVERTER_SN_OID, BATTERY_SOC_OID])
+    inverter_simulator.drop_rate = 1.0
+
+    with (
+        patch("custom_components.rct_power.lib.api.READ_TIMEOUT", 0.05),
+        pytest.raises(UpdateFailed),
+    ):
+        await client.async_get_data([INVERTER_SN_OID, BATTERY_SOC_OID])
+
+    assert client.circuit_breaker.failures == 1
+    assert client.metrics.objects[BATTERY_SOC_OID].failures.total() == 0
+
+
+async def test_skip_unsolicited_frames_of_unknown_objects(
+    client: RctPowerApiClient, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that frames of objects rctclient doesn't know don't fail the batch."""
+    await client.async_get_data([INVERTER_SN_OID])
+
+    inverter_simulator.send_frame(encode_response_frame(0x12345678, b"\x00" * 4))
+    inverter_simulator.send_frame(
+        encode_response_frame(BATTERY_SOC_OID, b"\x00" * 4, corrupt_crc=True)
+    )
+    await asyncio.sleep(0.01)
+
+    data = await client.async_get_data([INVERTER_SN_OID])
+
+    assert isinstance(data[INVERTER_SN_OID], ValidApiResponse)
+    assert client.circuit_breaker.failures == 0
+    assert client.pop_unsolicited_responses() == {}
+
+
+async def test_finish_batch_with_remaining_objects_received_unsolicited(
+    client: RctPowerApiClient, inverter_simulator: InverterSimulator
+) -> None:
+    """Test a batch whose last objects arrive unsolicited after the others timed out."""
+    object_ids = all_object_ids()[: PIPELINE_WINDOW_SIZE + 1]
+    await client.async_get_data([INVERTER_SN_OID])
+    inverter_simulator.drop_rate = 1.0
+    inverter_simulator.send_unsolicited(REGISTRY.get_by_id(object_ids[-1]).name)
+    await asyncio.sleep(0.01)
+
+    with patch("custom_components.rct_power.lib.api.READ_TIMEOUT", 0.05):
+        data = await client.async_get_data(object_ids)
+
+    assert isinstance(data[object_ids[-1]], ValidApiResponse)
+    assert all(
+        isinstance(data[object_id], InvalidApiResponse) for object_id in object_ids[:-1]
+    )
+
+
+async def test_keep_breaker_open_after_cancelled_probe(
+    client: RctPowerApiClient, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that a probe cancelled while waiting for the connection isn't started."""
+    inverter_simulator.latency = 0.1
+    batch = asyncio.create_task(client.async_get_data([INVERTER_SN_OID]))
+    await asyncio.sleep(0.01)
+
+    circuit_breaker = client.circuit_breaker
+    circuit_breaker.state = CircuitState.OPEN
+    probe = asyncio.create_task(client.async_get_data([INVERTER_SN_OID]))
+    await asyncio.sleep(0.01)
+    probe.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+    assert circuit_breaker.state is CircuitState.OPEN
+    assert circuit_breaker.allow_request(time.monotonic())
+
+    await batch
+
+
+async def test_report_crc_errors(
+    client: RctPowerApiClient, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that responses with a wrong checksum are reported as such."""
+    inverter_simulator.crc_error_rate = 1.0
+
+    data = await client.async_get_data([INVERTER_SN_OID, BATTERY_SOC_OID])
+
+    assert [
+        response.cause
+        for response in data.values()
+        if isinstance(response, InvalidApiResponse)
+    ] == ["CRC_ERROR", "CRC_ERROR"]
+
+
+async def test_harvest_unsolicited_frames(
+    client: RctPowerApiClient, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that values received without a request are used."""
+    object_ids = object_ids_for_update_priority(EntityUpdatePriority.FREQUENT)
+    object_ids = [
+        *[object_id for object_id in object_ids if object_id != BATTERY_SOC_OID],
+        BATTERY_SOC_OID,
+    ]
+    await client.async_get_data([INVERTER_SN_OID])
+    inverter_simulator.requested_object_ids.clear()
+
+    # received before the object's request was sent, so it isn't requested
+    inverter_simulator.set_value("battery.soc", 0.5)
+    inverter_simulator.send_unsolicited("battery.soc")
+    # not part of the batch, so it's kept for later
+    inverter_simulator.send_unsolicited("inverter_sn")
+    await asyncio.sleep(0.01)
+
+    data = await client.async_get_data(object_ids)
+
+    assert all(isinstance(response, ValidApiResponse) for response in data.values())
+    assert data[BATTERY_SOC_OID].value == 0.5  # type: ignore
+    assert inverter_simulator.requested_object_ids[BATTERY_SOC_OID] == 0
+    assert list(client.pop_unsolicited_responses()) == [INVERTER_SN_OID]
+    assert client.pop_unsolicited_responses() == {}
+
+
+def test_object_info_by_name_matches_registry() -> None:
+    """Test that the name lookup table resolves like the registry does."""
+    for object_name in ["inverter_sn", "battery.soc", "g_sync.p_ac[0]"]:
+        assert get_object_info_by_name(object_name) is REGISTRY.get_by_name(object_name)
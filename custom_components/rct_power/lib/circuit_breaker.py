@@ -0,0 +1,80 @@
+"""Fail fast while the inverter is unreachable, instead of queueing connections."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import StrEnum
+
+# consecutive failed batches after which requests fail right away
+FAILURE_THRESHOLD = 3
+# delay until the first probe in seconds, which doubles with each failed probe
+PROBE_BACKOFF = 30
+MAX_PROBE_BACKOFF = 60 * 10
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    # a single probe is in progress, other requests still fail
+    HALF_OPEN = "half_open"
+
+
+@dataclass(kw_only=True)
+class CircuitBreaker:
+    """Stop connecting to an unreachable inverter until a probe succeeds.
+
+    While closed, all requests pass. After failure_threshold consecutive
+    failures it opens and rejects requests until the probe time, when a single
+    request probes the inverter. Its success closes the breaker again, while
+    its failure postpones the next probe by twice the previous backoff.
+    """
+
+    failure_threshold: int = FAILURE_THRESHOLD
+    probe_backoff: float = PROBE_BACKOFF
+    max_probe_backoff: float = MAX_PROBE_BACKOFF
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    # monotonic time of the next probe while open
+    probe_time: float = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return self.state is CircuitState.OPEN
+
+    def rejects_request(self, now: float) -> bool:
+        """Tell whether a request would be rejected, without starting a probe."""
+        return self.state is CircuitState.HALF_OPEN or (
+            self.state is CircuitState.OPEN and now < self.probe_time
+        )
+
+    def allow_request(self, now: float) -> bool:
+        if self.state is CircuitState.CLOSED:
+            return True
+
+        if self.state is CircuitState.OPEN and now >= self.probe_time:
+            self.state = CircuitState.HALF_OPEN
+            return True
+
+        return False
+
+    def record_success(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+
+    def record_failure(self, now: float) -> None:
+        self.failures += 1
+
+        if (
+            self.state is CircuitState.HALF_OPEN
+            or self.failures >= self.failure_threshold
+        ):
+            self.state = CircuitState.OPEN
+            self.probe_time = now + min(
+                self.probe_backoff * 2 ** (self.failures - self.failure_threshold),
+                self.max_probe_backoff,
+            )
+
+    def abort_request(self) -> None:
+        """End a request without a result, so the next one probes again."""
+        if self.state is CircuitState.HALF_OPEN:
+            self.state = CircuitState.OPEN
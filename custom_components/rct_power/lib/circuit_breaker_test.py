@@ -0,0 +1,54 @@
+"""Test the circuit breaker of the API client."""
+
+from __future__ import annotations
+
+from .circuit_breaker import CircuitBreaker, CircuitState
+
+
+def test_open_after_consecutive_failures() -> None:
+    """Test that only consecutive failures open the breaker."""
+    circuit_breaker = CircuitBreaker(failure_threshold=2, probe_backoff=10)
+
+    circuit_breaker.record_failure(0)
+    circuit_breaker.record_success()
+    circuit_breaker.record_failure(0)
+    assert circuit_breaker.state is CircuitState.CLOSED
+    assert circuit_breaker.allow_request(0)
+
+    circuit_breaker.record_failure(5)
+    assert circuit_breaker.state is CircuitState.OPEN
+    assert circuit_breaker.probe_time == 15
+    assert circuit_breaker.rejects_request(14)
+    assert not circuit_breaker.allow_request(14)
+    # telling doesn't start a probe
+    assert not circuit_breaker.rejects_request(15)
+    assert circuit_breaker.state is CircuitState.OPEN
+
+
+def test_probe_with_exponential_backoff() -> None:
+    """Test that a single request probes and that failed probes back off."""
+    circuit_breaker = CircuitBreaker(
+        failure_threshold=1, probe_backoff=10, max_probe_backoff=30
+    )
+    circuit_breaker.record_failure(0)
+
+    assert circuit_breaker.allow_request(10)
+    assert circuit_breaker.state is CircuitState.HALF_OPEN
+    # the probe is in progress
+    assert not circuit_breaker.allow_request(10)
+
+    circuit_breaker.record_failure(10)
+    assert circuit_breaker.probe_time == 30
+    assert circuit_breaker.allow_request(30)
+    circuit_breaker.record_failure(30)
+    assert circuit_breaker.probe_time == 60
+
+    # a probe without a result doesn't postpone the next one
+    assert circuit_breaker.allow_request(60)
+    circuit_breaker.abort_request()
+    assert circuit_breaker.state is CircuitState.OPEN
+    assert circuit_breaker.allow_request(60)
+
+    circuit_breaker.record_success()
+    assert circuit_breaker.state is CircuitState.CLOSED
+    assert circuit_breaker.failures == 0
@@ -10,31 +10,21 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 
+DEVICE_CLASSES_BY_UNIT: dict[str, SensorDeviceClass] = {
+    UnitOfTemperature.CELSIUS: SensorDeviceClass.TEMPERATURE,
+    UnitOfTemperature.FAHRENHEIT: SensorDeviceClass.TEMPERATURE,
+    UnitOfTemperature.KELVIN: SensorDeviceClass.TEMPERATURE,
+    UnitOfElectricPotential.VOLT: SensorDeviceClass.VOLTAGE,
+    UnitOfElectricPotential.MILLIVOLT: SensorDeviceClass.VOLTAGE,
+    UnitOfElectricCurrent.AMPERE: SensorDeviceClass.CURRENT,
+    UnitOfElectricCurrent.MILLIAMPERE: SensorDeviceClass.CURRENT,
+    UnitOfPower.WATT: SensorDeviceClass.POWER,
+    UnitOfPower.KILO_WATT: SensorDeviceClass.POWER,
+    UnitOfApparentPower.VOLT_AMPERE: SensorDeviceClass.POWER,
+    UnitOfEnergy.KILO_WATT_HOUR: SensorDeviceClass.ENERGY,
+    UnitOfEnergy.WATT_HOUR: SensorDeviceClass.ENERGY,
+}
 
-def guess_device_class_from_unit(unit: str) -> SensorDeviceClass | None:
-    if unit in [
-        UnitOfTemperature.CELSIUS,
-        UnitOfTemperature.FAHRENHEIT,
-        UnitOfTemperature.KELVIN,
-    ]:
-        return SensorDeviceClass.TEMPERATURE
-    elif unit in [
-        UnitOfElectricPotential.VOLT,
-        UnitOfElectricPotential.MILLIVOLT,
-    ]:
-        return SensorDeviceClass.VOLTAGE
-    elif unit in [
-        UnitOfElectricCurrent.AMPERE,
-        UnitOfElectricCurrent.MILLIAMPERE,
-    ]:
-        return SensorDeviceClass.CURRENT
-    elif unit in [
-        UnitOfPower.WATT,
-        UnitOfPower.KILO_WATT,
-        UnitOfApparentPower.VOLT_AMPERE,
-    ]:
-        return SensorDeviceClass.POWER
-    elif unit in [UnitOfEnergy.KILO_WATT_HOUR, UnitOfEnergy.WATT_HOUR]:
-        return SensorDeviceClass.ENERGY
 
-    return None
+def guess_device_class_from_unit(unit: str) -> SensorDeviceClass | None:
+    return DEVICE_CLASSES_BY_UNIT.get(unit)
@@ -1,14 +1,59 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from homeassistant.helpers.device_registry import DeviceInfo
 
 from ..const import BATTERY_MODEL, DOMAIN, INVERTER_MODEL, NAME
 from .entity import RctPowerEntity
 
+# the objects the device infos are built from
+DEVICE_INFO_OBJECT_NAMES = [
+    "inverter_sn",
+    "android_description",
+    "svnversion",
+    "battery.bms_sn",
+    "battery.bms_software_version",
+]
+
+# the device infos only change with the objects they are built from, so all
+# entities of an entry share the same instances
+DEVICE_INFO_CACHE_SIZE = 8
+
 
 def get_inverter_device_info(entity: RctPowerEntity) -> DeviceInfo:
-    inverter_sn = str(entity.get_valid_api_response_value_by_name("inverter_sn", None))
+    return build_inverter_device_info(
+        inverter_sn=str(
+            entity.get_valid_api_response_value_by_name("inverter_sn", None)
+        ),
+        android_description=str(
+            entity.get_valid_api_response_value_by_name("android_description", "")
+        ),
+        svnversion=str(entity.get_valid_api_response_value_by_name("svnversion", "")),
+    )
+
 
+def get_battery_device_info(entity: RctPowerEntity) -> DeviceInfo:
+    return build_battery_device_info(
+        bms_sn=str(entity.get_valid_api_response_value_by_name("battery.bms_sn", None)),
+        bms_software_version=str(
+            entity.get_valid_api_response_value_by_name(
+                "battery.bms_software_version", ""
+            )
+        ),
+        android_description=str(
+            entity.get_valid_api_response_value_by_name("android_description", "")
+        ),
+        inverter_sn=str(
+            entity.get_valid_api_response_value_by_name("inverter_sn", None)
+        ),
+    )
+
+
+@lru_cache(maxsize=DEVICE_INFO_CACHE_SIZE)
+def build_inverter_device_info(
+    *, inverter_sn: str, android_description: str, svnversion: str
+) -> DeviceInfo:
     return DeviceInfo(
         identifiers={
             (
@@ -21,18 +66,21 @@ def get_inverter_device_info(entity: RctPowerEntity) -> DeviceInfo:
                 inverter_sn,
             ),
         },  # type: ignore
-        name=str(
-            entity.get_valid_api_response_value_by_name("android_description", ""),
-        ),
-        sw_version=str(entity.get_valid_api_response_value_by_name("svnversion", "")),
+        name=android_description,
+        sw_version=svnversion,
         model=INVERTER_MODEL,
         manufacturer=NAME,
     )
 
 
-def get_battery_device_info(entity: RctPowerEntity) -> DeviceInfo:
-    bms_sn = str(entity.get_valid_api_response_value_by_name("battery.bms_sn", None))
-
+@lru_cache(maxsize=DEVICE_INFO_CACHE_SIZE)
+def build_battery_device_info(
+    *,
+    bms_sn: str,
+    bms_software_version: str,
+    android_description: str,
+    inverter_sn: str,
+) -> DeviceInfo:
     return DeviceInfo(
         identifiers={
             (
@@ -45,16 +93,9 @@ def get_battery_device_info(entity: RctPowerEntity) -> DeviceInfo:
                 bms_sn,
             ),
         },  # type: ignore
-        name=f"Battery at {entity.get_valid_api_response_value_by_name('android_description', '')}",
-        sw_version=str(
-            entity.get_valid_api_response_value_by_name(
-                "battery.bms_software_version", ""
-            )
-        ),
+        name=f"Battery at {android_description}",
+        sw_version=bms_software_version,
         model=BATTERY_MODEL,
         manufacturer=NAME,
-        via_device=(
-            DOMAIN,
-            str(entity.get_valid_api_response_value_by_name("inverter_sn", None)),
-        ),
+        via_device=(DOMAIN, inverter_sn),
     )
@@ -0,0 +1,53 @@
+"""Test the device info helpers."""
+
+from __future__ import annotations
+
+from typing import cast
+
+from .api import ApiResponseValue
+from .device_info_helpers import get_battery_device_info, get_inverter_device_info
+from .entity import RctPowerEntity
+
+
+class FakeEntity:
+    def __init__(self, values: dict[str, ApiResponseValue]) -> None:
+        self.values = values
+
+    def get_valid_api_response_value_by_name(
+        self, object_name: str, default: ApiResponseValue | None = None
+    ) -> ApiResponseValue | None:
+        return self.values.get(object_name, default)
+
+
+VALUES: dict[str, ApiResponseValue] = {
+    "inverter_sn": "0123456789",
+    "android_description": "Garage",
+    "svnversion": "5000",
+    "battery.bms_sn": "9876543210",
+    "battery.bms_software_version": "1.2",
+}
+
+
+def make_entity(values: dict[str, ApiResponseValue]) -> RctPowerEntity:
+    return cast(RctPowerEntity, FakeEntity(values))
+
+
+def test_share_device_info_until_source_objects_change() -> None:
+    """Test that device infos are only rebuilt for changed source objects."""
+    inverter_device_info = get_inverter_device_info(make_entity(VALUES))
+    battery_device_info = get_battery_device_info(make_entity(VALUES))
+
+    assert inverter_device_info.get("name") == "Garage"
+    assert inverter_device_info.get("sw_version") == "5000"
+    assert battery_device_info.get("name") == "Battery at Garage"
+    assert battery_device_info.get("via_device") == ("rct_power", "0123456789")
+
+    assert get_inverter_device_info(make_entity(dict(VALUES))) is inverter_device_info
+    assert get_battery_device_info(make_entity(dict(VALUES))) is battery_device_info
+
+    updated_values = {**VALUES, "svnversion": "5001"}
+    assert (
+        get_inverter_device_info(make_entity(updated_values)).get("sw_version")
+        == "5001"
+    )
+    assert get_battery_device_info(make_entity(updated_values)) is battery_device_info
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import date, datetime
 from decimal import Decimal
 from functools import cached_property
-from typing import Any
+from time import monotonic
+from typing import Any, NamedTuple
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -13,60 +14,109 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.typing import UNDEFINED, StateType, UndefinedType
-from rctclient.registry import REGISTRY, ObjectInfo
-
-from ..const import CONF_ENTITY_PREFIX, ICON, EntityUpdatePriority
-from ..coordinator import RctPowerDataUpdateCoordinator
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from rctclient.registry import ObjectInfo
+
+from ..const import (
+    CONF_DEADBANDS,
+    CONF_ENTITY_PREFIX,
+    CONF_STATE_HEARTBEAT_INTERVAL,
+    DEFAULT_STATE_HEARTBEAT_INTERVAL,
+    DOMAIN,
+    ICON,
+    EntityUpdatePriority,
+)
+from ..coordinator import RctPowerDataUpdateCoordinator, RctPowerPollScheduler
+from ..models import RctDeadbandOptions
 from .api import (
     ApiResponse,
     ApiResponseValue,
     ValidApiResponse,
+    get_object_info_by_name,
     get_valid_response_value_or,
 )
-from .device_class_helpers import guess_device_class_from_unit
 from .multi_coordinator_entity import MultiCoordinatorEntity
+from .poll_metrics import PollMetrics
 from .state_helpers import (
+    SensorRenderPlan,
+    compile_render_plan,
     get_api_response_values_as_bitfield,
     get_first_api_response_value_as_state,
 )
 
+# float rounding errors of changes by a threshold, like 1.2 - 1.1, don't tip
+# them over the threshold
+DEADBAND_TOLERANCE = 1e-9
+
 
 class RctPowerEntity(MultiCoordinatorEntity):
     entity_description: RctPowerEntityDescription
     object_infos: list[ObjectInfo]
 
+    _last_published_state: PublishedState | None = None
+    _last_published_time: float = 0.0
+
     def __init__(
         self,
         coordinators: list[RctPowerDataUpdateCoordinator],
         config_entry: ConfigEntry,
         entity_description: RctPowerEntityDescription,
     ):
-        super().__init__(coordinators)
         self.config_entry = config_entry
         self.entity_description = (  # pyright: ignore [reportIncompatibleVariableOverride]
             entity_description
         )
         self.object_infos = resolve_object_infos(self.entity_description)
+        self.object_ids = tuple(
+            object_info.object_id for object_info in self.object_infos
+        )
+        # all coordinators of an entry share the response index of its scheduler
+        self.responses = coordinators[0].scheduler.responses
+        # only get notified when the objects of this entity were polled
+        super().__init__(coordinators, context=frozenset(self.object_ids))
+        self.state_heartbeat_interval: int = config_entry.options.get(
+            CONF_STATE_HEARTBEAT_INTERVAL, DEFAULT_STATE_HEARTBEAT_INTERVAL
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        published_state = PublishedState(
+            self.available, self.state, self.extra_state_attributes
+        )
+        now = monotonic()
+
+        if self._last_published_state is not None and not self.is_significant_change(
+            self._last_published_state,
+            published_state,
+            now - self._last_published_time,
+        ):
+            return
+
+        self._last_published_state = published_state
+        self._last_published_time = now
+        super()._handle_coordinator_update()
+
+    def is_significant_change(
+        self, previous: PublishedState, current: PublishedState, silence: float
+    ) -> bool:
+        # skip writing unchanged states, except for a periodic heartbeat
+        return previous != current or silence >= self.state_heartbeat_interval
 
     def get_api_response_by_id(
         self, object_id: int, default: ApiResponse | None = None
     ) -> ApiResponse | None:
-        for coordinator in self.coordinators:
-            latest_response = coordinator.get_latest_response(object_id)
-
-            if latest_response is not None:
-                return latest_response
-
-        return default
+        return self.responses.get(object_id, default)
 
     def get_api_response_by_name(
         self, object_name: str, default: ApiResponse | None = None
     ) -> ApiResponse | None:
         return self.get_api_response_by_id(
-            REGISTRY.get_by_name(object_name).object_id, default
+            get_object_info_by_name(object_name).object_id, default
         )
 
     def get_valid_api_response_value_by_id[R: ApiResponseValue](
@@ -86,13 +136,7 @@ class RctPowerEntity(MultiCoordinatorEntity):
     @cached_property
     def unique_id(self) -> str | None:
         """Return a unique ID to use for this entity."""
-        # this allows for keeping the entity identity stable for existing
-        # sensors when the algorithm below changes
-        if uid := self.entity_description.unique_id:
-            return f"{self.config_entry.entry_id}-{uid}"
-
-        object_ids = [str(object_info.object_id) for object_info in self.object_infos]
-        return "-".join([self.config_entry.entry_id, *object_ids])
+        return get_entity_unique_id(self.config_entry.entry_id, self.entity_description)
 
     @property
     def name(self) -> str | UndefinedType | None:
@@ -107,11 +151,13 @@ class RctPowerEntity(MultiCoordinatorEntity):
 
     @property
     def available(self) -> bool:
-        return all(
-            isinstance(
-                self.get_api_response_by_id(object_info.object_id), ValidApiResponse
-            )
-            for object_info in self.object_infos
+        responses = self.responses
+
+        # the responses of the last successful batch are kept while the
+        # inverter is unreachable, so they can't tell on their own
+        return super().available and all(
+            isinstance(responses.get(object_id), ValidApiResponse)
+            for object_id in self.object_ids
         )
 
     @cached_property
@@ -133,22 +179,50 @@ class RctPowerEntity(MultiCoordinatorEntity):
 class RctPowerSensorEntity(SensorEntity, RctPowerEntity):
     entity_description: RctPowerSensorEntityDescription  # pyright: ignore [reportIncompatibleVariableOverride]
 
+    @cached_property
+    def deadband(self) -> Deadband | None:
+        return resolve_deadband(
+            self.entity_description,
+            self.config_entry.options.get(CONF_DEADBANDS, {}).get(
+                self.entity_description.key
+            ),
+        )
+
+    def is_significant_change(
+        self, previous: PublishedState, current: PublishedState, silence: float
+    ) -> bool:
+        if (
+            self.deadband is not None
+            and isinstance(previous.state, int | float)
+            and isinstance(current.state, int | float)
+            and previous.available == current.available
+            and previous.attributes == current.attributes
+            and silence < self.deadband.max_silence
+        ):
+            # compare to the last published state, so slow drifts still show up
+            return self.deadband.is_exceeded(previous.state, current.state)
+
+        return super().is_significant_change(previous, current, silence)
+
     def get_valid_api_responses(self) -> list[ApiResponseValue | None]:
+        # read on every state write, so skip the lookups by name and id
+        responses = self.responses
+
         return [
-            self.get_valid_api_response_value_by_id(object_info.object_id, None)
-            for object_info in self.object_infos
+            get_valid_response_value_or(responses.get(object_id), None)
+            for object_id in self.object_ids
         ]
 
+    @cached_property
+    def render_plan(self) -> SensorRenderPlan:
+        return compile_render_plan(
+            super().device_class, self.native_unit_of_measurement
+        )
+
     @property
     def device_class(self) -> SensorDeviceClass | None:
         """Return the device class of the sensor."""
-        if device_class := super().device_class:
-            return device_class
-
-        if self.native_unit_of_measurement:
-            return guess_device_class_from_unit(self.native_unit_of_measurement)
-
-        return None
+        return self.render_plan.device_class
 
     @property
     def native_value(self) -> StateType | date | datetime | Decimal:
@@ -165,6 +239,10 @@ class RctPowerSensorEntity(SensorEntity, RctPowerEntity):
 
 
 class RctPowerBitfieldSensorEntity(RctPowerSensorEntity):
+    @cached_property
+    def deadband(self) -> Deadband | None:
+        return None
+
     @cached_property
     def native_unit_of_measurement(self) -> str | None:
         return None
@@ -190,6 +268,92 @@ class RctPowerBitfieldSensorEntity(RctPowerSensorEntity):
         }
 
 
+class RctPowerPollMetricsSensorEntity(
+    CoordinatorEntity[RctPowerPollScheduler], SensorEntity
+):
+    """Sensor of the measurements of the polls, updated after each batch."""
+
+    entity_description: RctPowerPollMetricsSensorEntityDescription  # pyright: ignore [reportIncompatibleVariableOverride]
+    # the histograms change with every batch, so keep them out of the recorder
+    _unrecorded_attributes = frozenset({"samples", "p50", "p95", "histogram"})
+
+    def __init__(
+        self,
+        scheduler: RctPowerPollScheduler,
+        config_entry: ConfigEntry,
+        entity_description: RctPowerPollMetricsSensorEntityDescription,
+    ) -> None:
+        super().__init__(scheduler)
+        self.config_entry = config_entry
+        self.entity_description = entity_description  # pyright: ignore [reportIncompatibleVariableOverride]
+        self._attr_unique_id = f"{config_entry.entry_id}-{entity_description.key}"
+        self._attr_name = (
+            f"{config_entry.data[CONF_ENTITY_PREFIX]} {entity_description.name}"
+        )
+
+    @property
+    def available(self) -> bool:  # pyright: ignore [reportIncompatibleVariableOverride]
+        # failed batches are measured as well
+        return True
+
+    @property
+    def native_value(self) -> StateType:  # pyright: ignore [reportIncompatibleVariableOverride]
+        return self.entity_description.get_native_value(self.coordinator.client.metrics)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:  # pyright: ignore [reportIncompatibleVariableOverride]
+        if self.entity_description.get_attributes is None:
+            return None
+
+        return self.entity_description.get_attributes(self.coordinator.client.metrics)
+
+    @property
+    def device_info(self) -> DeviceInfo | None:  # pyright: ignore [reportIncompatibleVariableOverride]
+        inverter_sn = get_valid_response_value_or(
+            self.coordinator.responses.get(
+                get_object_info_by_name("inverter_sn").object_id
+            ),
+            None,
+        )
+        # registered by the sensors of the inverter already
+        return DeviceInfo(identifiers={(DOMAIN, str(inverter_sn))})
+
+
+class PublishedState(NamedTuple):
+    available: bool
+    state: StateType
+    attributes: dict[str, Any] | None
+
+
+@dataclass(frozen=True, kw_only=True)
+class Deadband:
+    """Change a numeric state needs before it is published again."""
+
+    absolute: float | None = None
+    # relative to the last published state
+    relative: float | None = None
+    # publish changes within the deadband after this many seconds anyway
+    max_silence: int = 60 * 5
+
+    def is_exceeded(self, previous: float, current: float) -> bool:
+        # thresholds of 0, like the relative one of an idle value of 0, are
+        # only exceeded by actual changes
+        if previous == current:
+            return False
+
+        if self.absolute is None and self.relative is None:
+            return True
+
+        change = abs(current - previous)
+
+        return (
+            self.absolute is not None and change > self.absolute + DEADBAND_TOLERANCE
+        ) or (
+            self.relative is not None
+            and change > abs(previous) * self.relative + DEADBAND_TOLERANCE
+        )
+
+
 @dataclass(frozen=True, kw_only=True)
 class RctPowerEntityDescription(EntityDescription):
     icon: str | None = ICON
@@ -208,6 +372,8 @@ class RctPowerSensorEntityDescription(
         [RctPowerSensorEntity, list[ApiResponseValue | None]],
         StateType | date | datetime | Decimal,
     ] = get_first_api_response_value_as_state
+    # to avoid publishing measurement noise
+    deadband: Deadband | None = None
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -220,15 +386,48 @@ class RctPowerBitfieldSensorEntityDescription(
     ] = get_api_response_values_as_bitfield
 
 
+@dataclass(frozen=True, kw_only=True)
+class RctPowerPollMetricsSensorEntityDescription(SensorEntityDescription):
+    entity_category: EntityCategory | None = EntityCategory.DIAGNOSTIC
+    entity_registry_enabled_default: bool = False
+    get_native_value: Callable[[PollMetrics], StateType]
+    get_attributes: Callable[[PollMetrics], dict[str, Any]] | None = None
+
+
 def slugify_entity_name(name: str) -> str:
     return name.replace(".", "_").replace("[", "_").replace("]", "_").replace("?", "_")
 
 
+def resolve_deadband(
+    entity_description: RctPowerSensorEntityDescription,
+    deadband_options: RctDeadbandOptions | None,
+) -> Deadband | None:
+    if deadband_options is None:
+        return entity_description.deadband
+
+    return replace(entity_description.deadband or Deadband(), **deadband_options)
+
+
+def get_entity_unique_id(
+    entry_id: str, entity_description: RctPowerEntityDescription
+) -> str:
+    # this allows for keeping the entity identity stable for existing
+    # sensors when the algorithm below changes
+    if uid := entity_description.unique_id:
+        return f"{entry_id}-{uid}"
+
+    object_ids = [
+        str(object_info.object_id)
+        for object_info in resolve_object_infos(entity_description)
+    ]
+    return "-".join([entry_id, *object_ids])
+
+
 def resolve_object_infos(
     entity_description: RctPowerEntityDescription,
 ) -> list[ObjectInfo]:
     object_names = entity_description.object_names or [entity_description.key]
-    return [REGISTRY.get_by_name(object_name) for object_name in object_names]
+    return [get_object_info_by_name(object_name) for object_name in object_names]
 
 
 known_faults: list[str] = [
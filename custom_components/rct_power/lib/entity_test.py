@@ -0,0 +1,196 @@
+"""Test the RCT Power entities."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.const import (
+    EVENT_STATE_CHANGED,
+    EVENT_STATE_REPORTED,
+    EntityCategory,
+)
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    EventStateReportedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.rct_power.const import (
+    CONF_DEADBANDS,
+    CONF_STATE_HEARTBEAT_INTERVAL,
+    DOMAIN,
+)
+from tests.common import FakeClock, async_setup_simulator_entry
+from tests.simulator import InverterSimulator
+
+from .entity import Deadband
+
+BATTERY_SOC_ENTITY_ID = "sensor.rct_power_storage_battery_state_of_charge"
+BATTERY_CURRENT_ENTITY_ID = "sensor.rct_power_storage_battery_current"
+
+
+async def test_skip_unchanged_states(
+    hass: HomeAssistant, clock: FakeClock, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that unchanged states are only written on the heartbeat."""
+    inverter_simulator.set_value("battery.soc", 0.5)
+    config_entry = await async_setup_simulator_entry(
+        hass, inverter_simulator, options={CONF_STATE_HEARTBEAT_INTERVAL: 600}
+    )
+    scheduler = config_entry.runtime_data.scheduler
+    state_writes: list[Event[Any]] = []
+
+    @callback
+    def is_battery_soc_event(
+        event_data: EventStateChangedData | EventStateReportedData,
+    ) -> bool:
+        return event_data["entity_id"] == BATTERY_SOC_ENTITY_ID
+
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED, state_writes.append, event_filter=is_battery_soc_event
+    )
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED, state_writes.append, event_filter=is_battery_soc_event
+    )
+
+    # the first update after adding the entity is always written
+    clock.time += 30
+    await scheduler.async_refresh()
+    await hass.async_block_till_done()
+    state_writes.clear()
+
+    clock.time += 30
+    await scheduler.async_refresh()
+    await hass.async_block_till_done()
+    assert state_writes == []
+
+    inverter_simulator.set_value("battery.soc", 0.6)
+    clock.time += 30
+    await scheduler.async_refresh()
+    await hass.async_block_till_done()
+    assert [event.event_type for event in state_writes] == [EVENT_STATE_CHANGED]
+    state = hass.states.get(BATTERY_SOC_ENTITY_ID)
+    assert state is not None
+    assert state.state == "60.0"
+
+    state_writes.clear()
+    clock.time += 600
+    await scheduler.async_refresh()
+    await hass.async_block_till_done()
+    assert [event.event_type for event in state_writes] == [EVENT_STATE_REPORTED]
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_publish_changes_beyond_deadband(
+    hass: HomeAssistant, clock: FakeClock, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that changes within the deadband are only published after a while."""
+    inverter_simulator.set_value("battery.current", 1.0)
+    config_entry = await async_setup_simulator_entry(
+        hass,
+        inverter_simulator,
+        options={
+            CONF_DEADBANDS: {"battery.current": {"absolute": 0.5, "max_silence": 120}}
+        },
+    )
+    scheduler = config_entry.runtime_data.scheduler
+
+    async def async_poll_current(value: float) -> str:
+        inverter_simulator.set_value("battery.current", value)
+        clock.time += 30
+        await scheduler.async_refresh()
+        await hass.async_block_till_done()
+
+        state = hass.states.get(BATTERY_CURRENT_ENTITY_ID)
+        assert state is not None
+        return state.state
+
+    assert await async_poll_current(1.0) == "1.0"
+    assert await async_poll_current(1.3) == "1.0"
+    # the deadband is relative to the last published state
+    assert await async_poll_current(1.6) == "1.6"
+    assert await async_poll_current(1.8) == "1.6"
+    assert await async_poll_current(1.8) == "1.6"
+    assert await async_poll_current(1.8) == "1.6"
+    # small changes are published once max_silence passed
+    assert await async_poll_current(1.8) == "1.8"
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_poll_metrics_sensors(
+    hass: HomeAssistant, clock: FakeClock, inverter_simulator: InverterSimulator
+) -> None:
+    """Test that the measurements of the polls are disabled diagnostic sensors."""
+    entity_registry = er.async_get(hass)
+    inverter_simulator.set_supported("io_board.s0_external_power", False)
+    # enabled before the setup, as Home Assistant only adds enabled entities
+    entity_registry.async_get_or_create(
+        "sensor",
+        DOMAIN,
+        "test-poll_metrics.invalid_responses",
+        suggested_object_id="rct_power_storage_poll_invalid_responses",
+    )
+
+    with patch("custom_components.rct_power.lib.api.READ_TIMEOUT", 0.2):
+        config_entry = await async_setup_simulator_entry(hass, inverter_simulator)
+
+    metrics = config_entry.runtime_data.client.metrics
+    # the device objects and then the remaining ones
+    assert metrics.cycles == 2
+    assert len(metrics.connect_times) == 1
+    assert 0 < len(metrics.round_trip_times) < metrics.objects_read
+
+    duration_entry = entity_registry.async_get("sensor.rct_power_storage_poll_duration")
+    assert duration_entry is not None
+    assert duration_entry.disabled_by is er.RegistryEntryDisabler.INTEGRATION
+    assert duration_entry.entity_category is EntityCategory.DIAGNOSTIC
+
+    state = hass.states.get("sensor.rct_power_storage_poll_invalid_responses")
+    assert state is not None
+    assert state.state == "1"
+    assert state.attributes["OBJECT_READ_TIMEOUT"] == 1
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+def test_deadband_thresholds() -> None:
+    """Test absolute and relative deadband thresholds."""
+    assert not Deadband(absolute=10).is_exceeded(100, 109)
+    assert not Deadband(absolute=10).is_exceeded(100, 90)
+    assert Deadband(absolute=10).is_exceeded(100, 89)
+    assert not Deadband(relative=0.1).is_exceeded(-100, -110)
+    assert Deadband(relative=0.1).is_exceeded(-100, -111)
+    assert Deadband(absolute=10, relative=0.01).is_exceeded(1000, 1011)
+    assert Deadband().is_exceeded(1, 1.01)
+    assert not Deadband().is_exceeded(1, 1)
+
+
+def test_deadband_of_equal_steps() -> None:
+    """Test that equal steps are treated alike, regardless of rounding errors."""
+    battery_current = Deadband(absolute=0.1)
+    for previous, current in [(1.0, 1.1), (1.1, 1.2), (-0.1, 0.0), (0.7, 0.8)]:
+        assert not battery_current.is_exceeded(previous, current)
+        assert battery_current.is_exceeded(previous, round(current + 0.1, 1))
+
+    grid_frequency = Deadband(absolute=0.01)
+    for previous, current in [(50.0, 50.01), (50.01, 50.02), (49.99, 50.0)]:
+        assert not grid_frequency.is_exceeded(previous, current)
+        assert grid_frequency.is_exceeded(previous, round(current + 0.01, 2))
+
+
+def test_deadband_of_idle_value() -> None:
+    """Test that an idle value of 0 doesn't exceed any deadband."""
+    assert not Deadband(relative=0.1).is_exceeded(0, 0)
+    assert not Deadband(absolute=0).is_exceeded(0, 0)
+    assert not Deadband(absolute=0, relative=0).is_exceeded(0, 0)
+    assert Deadband(relative=0.1).is_exceeded(0, 0.1)
+    assert Deadband(absolute=0).is_exceeded(0, 0.1)
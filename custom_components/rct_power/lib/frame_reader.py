@@ -0,0 +1,171 @@
+"""Buffered decoding of the frames received from the inverter."""
+
+from __future__ import annotations
+
+from asyncio import StreamReader
+from binascii import crc_hqx
+from dataclasses import dataclass
+
+from rctclient.frame import ESCAPE_TOKEN, START_TOKEN
+from rctclient.types import Command
+
+READ_CHUNK_SIZE = 4096
+
+# the command and the (up to two byte long) length field
+FRAME_HEADER_LENGTH = 3
+FRAME_ID_LENGTH = 4
+FRAME_ADDRESS_LENGTH = 4
+FRAME_CRC_LENGTH = 2
+# the commands frames start with, so neither extensions nor rctclient's sentinel
+FRAME_COMMANDS = {
+    command.value: command
+    for command in Command
+    if command is not Command.EXTENSION and not command.name.startswith("_")
+}
+
+
+@dataclass(slots=True, frozen=True)
+class DecodedFrame:
+    command: Command
+    id: int
+    data: bytes
+    crc_ok: bool
+
+
+class FrameDecoder:
+    """Incrementally decode frames from chunks of the raw byte stream.
+
+    In contrast to rctclient's ReceiveFrame, which consumes one byte at a time,
+    this scans whole chunks for frame boundaries and keeps any leftover bytes
+    for the next frame.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> None:
+        self._buffer += data
+
+    def next_frame(self) -> DecodedFrame | None:
+        """Return the next complete frame or None, if more data is needed."""
+        buffer = self._buffer
+
+        while True:
+            start = buffer.find(START_TOKEN)
+
+            if start < 0:
+                # no frame start in sight, so nothing in the buffer is usable
+                buffer.clear()
+                return None
+
+            # ignore any data before the start of the frame
+            del buffer[:start]
+
+            unescaped_header = self._unescape(FRAME_HEADER_LENGTH)
+
+            if unescaped_header is None:
+                return None
+
+            header, _ = unescaped_header
+
+            command = FRAME_COMMANDS.get(header[0])
+
+            if command is None:
+                # not a frame after all, so resync at the next start token
+                del buffer[:1]
+                continue
+
+            if Command.is_long(command):
+                length_field_size = 2
+                length = int.from_bytes(header[1:3])
+            else:
+                length_field_size = 1
+                length = header[1]
+
+            body_length = 1 + length_field_size + length
+            unescaped_frame = self._unescape(body_length + FRAME_CRC_LENGTH)
+
+            if unescaped_frame is None:
+                return None
+
+            frame, frame_end = unescaped_frame
+            del buffer[:frame_end]
+
+            id_start = 1 + length_field_size
+            if Command.is_plant(command):
+                id_start += FRAME_ADDRESS_LENGTH
+
+            if id_start + FRAME_ID_LENGTH > body_length:
+                # the length field is too short to even hold the object id
+                continue
+
+            crc = int.from_bytes(frame[body_length:])
+
+            return DecodedFrame(
+                command=command,
+                id=int.from_bytes(frame[id_start : id_start + FRAME_ID_LENGTH]),
+                data=bytes(frame[id_start + FRAME_ID_LENGTH : body_length]),
+                crc_ok=crc16(frame[:body_length]) == crc,
+            )
+
+    def _unescape(self, length: int) -> tuple[bytearray, int] | None:
+        """Unescape the first bytes following the start token.
+
+        Returns the unescaped bytes and the buffer position right after them or
+        None, if the buffer doesn't hold enough data yet.
+        """
+        buffer = self._buffer
+        buffer_length = len(buffer)
+        unescaped = bytearray()
+        position = len(START_TOKEN)
+
+        while (missing_length := length - len(unescaped)) > 0:
+            end = position + missing_length
+
+            if end > buffer_length:
+                return None
+
+            escape = buffer.find(ESCAPE_TOKEN, position, end)
+
+            if escape < 0:
+                unescaped += buffer[position:end]
+                position = end
+            elif escape + 1 < buffer_length:
+                unescaped += buffer[position:escape]
+                unescaped.append(buffer[escape + 1])
+                position = escape + 2
+            else:
+                return None
+
+        return unescaped, position
+
+
+def crc16(data: bytes | bytearray) -> int:
+    """Calculate the same checksum as rctclient's CRC16, but table-driven."""
+    # rctclient pads data of uneven length with a zero byte
+    if len(data) & 0x01:
+        data = bytes(data) + b"\x00"
+
+    return crc_hqx(data, 0xFFFF)
+
+
+class FrameStreamReader:
+    """Asynchronously iterate over the frames received on a stream."""
+
+    def __init__(self, reader: StreamReader) -> None:
+        self._reader = reader
+        self._decoder = FrameDecoder()
+
+    def __aiter__(self) -> FrameStreamReader:
+        return self
+
+    async def __anext__(self) -> DecodedFrame:
+        while (frame := self._decoder.next_frame()) is None:
+            chunk = await self._reader.read(READ_CHUNK_SIZE)
+
+            if not chunk:
+                raise StopAsyncIteration
+
+            self._decoder.feed(chunk)
+
+        return frame
@@ -0,0 +1,103 @@
+"""Test the buffered frame decoding."""
+
+from __future__ import annotations
+
+from asyncio import StreamReader
+
+from rctclient.frame import SendFrame
+from rctclient.types import Command, DataType
+from rctclient.utils import CRC16, encode_value
+
+from .frame_reader import DecodedFrame, FrameDecoder, FrameStreamReader, crc16
+
+# contains both the start and the escape token, so it needs escaping
+ESCAPED_OBJECT_ID = 0x2B2D2B2D
+
+
+def make_response(object_id: int, value: str) -> bytes:
+    return SendFrame(
+        command=Command.RESPONSE,
+        id=object_id,
+        payload=encode_value(DataType.STRING, value),
+    ).data
+
+
+def decode_all(decoder: FrameDecoder) -> list[DecodedFrame]:
+    frames: list[DecodedFrame] = []
+
+    while (frame := decoder.next_frame()) is not None:
+        frames.append(frame)
+
+    return frames
+
+
+def test_decode_escaped_frames() -> None:
+    """Test that escape tokens in ids and payloads are removed."""
+    decoder = FrameDecoder()
+    decoder.feed(make_response(ESCAPED_OBJECT_ID, "+-+"))
+    decoder.feed(make_response(0x7924ABD9, "serial"))
+
+    assert decode_all(decoder) == [
+        DecodedFrame(
+            command=Command.RESPONSE,
+            id=ESCAPED_OBJECT_ID,
+            data=b"+-+",
+            crc_ok=True,
+        ),
+        DecodedFrame(
+            command=Command.RESPONSE, id=0x7924ABD9, data=b"serial", crc_ok=True
+        ),
+    ]
+
+
+def test_decode_frames_split_across_chunks() -> None:
+    """Test that partial frames are kept until the rest arrives."""
+    stream = make_response(ESCAPED_OBJECT_ID, "-") + make_response(0x1, "+")
+    decoder = FrameDecoder()
+    frames: list[DecodedFrame] = []
+
+    for position in range(len(stream)):
+        decoder.feed(stream[position : position + 1])
+        frames.extend(decode_all(decoder))
+
+    assert [(frame.id, frame.data) for frame in frames] == [
+        (ESCAPED_OBJECT_ID, b"-"),
+        (0x1, b"+"),
+    ]
+
+
+def test_skip_garbage_and_invalid_commands() -> None:
+    """Test that the decoder resyncs at the next start token."""
+    decoder = FrameDecoder()
+    decoder.feed(b"\x00\x00+\xff\x00" + make_response(0x1, "a"))
+
+    assert [frame.id for frame in decode_all(decoder)] == [0x1]
+
+
+def test_report_crc_mismatch() -> None:
+    """Test that frames with a wrong checksum are flagged."""
+    frame = bytearray(make_response(0x1, "abc"))
+    frame[-1] ^= 0x01
+    decoder = FrameDecoder()
+    decoder.feed(bytes(frame) + make_response(0x2, "def"))
+
+    assert [(frame.id, frame.crc_ok) for frame in decode_all(decoder)] == [
+        (0x1, False),
+        (0x2, True),
+    ]
+
+
+def test_crc16_matches_rctclient() -> None:
+    """Test that the checksum matches the reference implementation."""
+    for data in [b"", b"\x01", b"\x05\x08\x79\x24\xab\xd9abc", bytes(range(255))]:
+        assert crc16(data) == CRC16(data)
+
+
+async def test_stream_reader_yields_frames() -> None:
+    """Test iterating over the frames of a stream until it ends."""
+    reader = StreamReader()
+    reader.feed_data(make_response(0x1, "a") + make_response(0x2, "b")[:5])
+    reader.feed_data(make_response(0x2, "b")[5:])
+    reader.feed_eof()
+
+    assert [frame.id async for frame in FrameStreamReader(reader)] == [0x1, 0x2]
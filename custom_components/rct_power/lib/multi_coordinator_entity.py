@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from asyncio.tasks import gather
+from typing import Any
 
 from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
@@ -13,8 +14,11 @@ class MultiCoordinatorEntity(Entity):
 
     _attr_should_poll = False
 
-    def __init__(self, coordinators: list[RctPowerDataUpdateCoordinator]) -> None:
+    def __init__(
+        self, coordinators: list[RctPowerDataUpdateCoordinator], context: Any = None
+    ) -> None:
         self.coordinators = coordinators
+        self.coordinator_context = context
 
     @property
     def available(self) -> bool:
@@ -25,7 +29,9 @@ class MultiCoordinatorEntity(Entity):
 
         for coordinator in self.coordinators:
             self.async_on_remove(
-                coordinator.async_add_listener(self._handle_coordinator_update)
+                coordinator.async_add_listener(
+                    self._handle_coordinator_update, self.coordinator_context
+                )
             )
 
     @callback
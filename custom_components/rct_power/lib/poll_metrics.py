@@ -0,0 +1,130 @@
+"""Measure the polls of the API client, to tune the intervals from data."""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from .frame_reader import DecodedFrame
+
+# number of the latest samples the rolling histograms are built from
+ROLLING_WINDOW_SIZE = 500
+# upper bounds of the histogram buckets in seconds
+HISTOGRAM_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0)
+# number of the latest batches kept with all their measurements
+RECENT_CYCLES_SIZE = 50
+
+
+class RollingHistogram:
+    """Distribution of the latest samples of a duration."""
+
+    __slots__ = ("_samples",)
+
+    def __init__(self, size: int = ROLLING_WINDOW_SIZE) -> None:
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    @property
+    def last(self) -> float | None:
+        return self._samples[-1] if self._samples else None
+
+    def add(self, sample: float) -> None:
+        self._samples.append(sample)
+
+    def quantile(self, quantile: float) -> float | None:
+        if not self._samples:
+            return None
+
+        samples = sorted(self._samples)
+        return samples[min(int(quantile * len(samples)), len(samples) - 1)]
+
+    def bucket_counts(self) -> dict[str, int]:
+        """Count the samples by the upper bound of their bucket in seconds."""
+        counts = dict.fromkeys([*map(str, HISTOGRAM_BUCKETS), "inf"], 0)
+
+        for sample in self._samples:
+            bucket = next(
+                (str(bound) for bound in HISTOGRAM_BUCKETS if sample <= bound), "inf"
+            )
+            counts[bucket] += 1
+
+        return counts
+
+
+@dataclass(slots=True, kw_only=True)
+class PollCycle:
+    """Measurements of a single batch, all durations in seconds."""
+
+    # waiting for the batches of other callers
+    lock_wait_time: float
+    # 0 if the connection of the previous batch was reused
+    connect_time: float = 0.0
+    duration: float = 0.0
+    objects: int = 0
+    # invalid responses by their cause
+    invalid_responses: Counter[str] = field(default_factory=Counter[str])
+    # the error that ended the batch early, if any
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class ObjectHealth:
+    """Responses of a single object since the client was created."""
+
+    successes: int = 0
+    # invalid responses by their cause
+    failures: Counter[str] = field(default_factory=Counter[str])
+    last_round_trip_time: float | None = None
+    last_frame: DecodedFrame | None = None
+
+
+class PollMetrics:
+    """Counters and rolling histograms of the batches of an API client."""
+
+    def __init__(self) -> None:
+        self.last_cycle: PollCycle | None = None
+        self.cycles = 0
+        self.failed_cycles = 0
+        self.objects_read = 0
+        self.invalid_responses: Counter[str] = Counter()
+        self.recent_cycles: deque[PollCycle] = deque(maxlen=RECENT_CYCLES_SIZE)
+        self.objects: dict[int, ObjectHealth] = {}
+
+        self.lock_wait_times = RollingHistogram()
+        self.connect_times = RollingHistogram()
+        self.cycle_durations = RollingHistogram()
+        # of each object, from sending its request until its response arrived
+        self.round_trip_times = RollingHistogram()
+
+    def get_object_health(self, object_id: int) -> ObjectHealth:
+        if (health := self.objects.get(object_id)) is None:
+            health = self.objects[object_id] = ObjectHealth()
+
+        return health
+
+    def record_cycle(self, cycle: PollCycle) -> None:
+        self.last_cycle = cycle
+        self.recent_cycles.append(cycle)
+        self.cycles += 1
+        self.objects_read += cycle.objects
+        self.invalid_responses.update(cycle.invalid_responses)
+
+        if cycle.error is not None:
+            self.failed_cycles += 1
+
+        self.lock_wait_times.add(cycle.lock_wait_time)
+        if cycle.connect_time:
+            self.connect_times.add(cycle.connect_time)
+        self.cycle_durations.add(cycle.duration)
+
+
+def get_histogram_attributes(histogram: RollingHistogram) -> dict[str, Any]:
+    return {
+        "samples": len(histogram),
+        "p50": histogram.quantile(0.5),
+        "p95": histogram.quantile(0.95),
+        "histogram": histogram.bucket_counts(),
+    }
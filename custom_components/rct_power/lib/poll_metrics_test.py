@@ -0,0 +1,60 @@
+"""Test the measurements of the polls."""
+
+from __future__ import annotations
+
+from collections import Counter
+
+from .poll_metrics import PollCycle, PollMetrics, RollingHistogram
+
+
+def test_rolling_histogram() -> None:
+    """Test that the histogram only holds the latest samples."""
+    histogram = RollingHistogram(size=4)
+    assert histogram.last is None
+    assert histogram.quantile(0.5) is None
+
+    for sample in (30.0, 0.005, 0.02, 0.3, 0.04):
+        histogram.add(sample)
+
+    assert len(histogram) == 4
+    assert histogram.last == 0.04
+    assert histogram.quantile(0.5) == 0.04
+    assert histogram.quantile(1) == 0.3
+    counts = histogram.bucket_counts()
+    assert counts["0.01"] == 1
+    assert counts["0.025"] == 1
+    assert counts["0.05"] == 1
+    assert counts["0.5"] == 1
+    assert counts["inf"] == 0
+
+
+def test_record_cycles() -> None:
+    """Test that the cycles add up and only connections count as connect time."""
+    metrics = PollMetrics()
+    metrics.record_cycle(
+        PollCycle(
+            lock_wait_time=0.0,
+            connect_time=0.1,
+            duration=0.5,
+            objects=10,
+            invalid_responses=Counter({"OBJECT_READ_TIMEOUT": 2}),
+        )
+    )
+    metrics.record_cycle(
+        PollCycle(
+            lock_wait_time=0.2,
+            duration=0.3,
+            objects=5,
+            invalid_responses=Counter({"OBJECT_READ_TIMEOUT": 1, "CRC_ERROR": 1}),
+        )
+    )
+    metrics.record_cycle(PollCycle(lock_wait_time=0.0, error="TimeoutError"))
+
+    assert metrics.cycles == 3
+    assert metrics.failed_cycles == 1
+    assert metrics.objects_read == 15
+    assert metrics.invalid_responses == {"OBJECT_READ_TIMEOUT": 3, "CRC_ERROR": 1}
+    assert len(metrics.connect_times) == 1
+    assert metrics.lock_wait_times.quantile(1) == 0.2
+    assert metrics.last_cycle is not None
+    assert metrics.last_cycle.error == "TimeoutError"
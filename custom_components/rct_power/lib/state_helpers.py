@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import datetime
-from typing import Literal, get_args
+from functools import cached_property
+from typing import Literal, NamedTuple, Protocol, get_args
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.helpers.typing import StateType
 from homeassistant.util.dt import as_local
 
@@ -13,42 +15,95 @@ from .const import (
     NUMERIC_STATE_DECIMAL_DIGITS,
     BatteryStatusFlag,
 )
+from .device_class_helpers import guess_device_class_from_unit
 
+type ValueFormatter = Callable[[ApiResponseValue | None], StateType]
 
-def get_first_api_response_value_as_state(
-    entity: SensorEntity,
-    values: list[ApiResponseValue | None],
-) -> StateType:
-    if len(values) <= 0:
-        return None
 
-    return get_api_response_value_as_state(entity=entity, value=values[0])
+class SensorRenderPlan(NamedTuple):
+    """How to render a sensor, resolved once from its description."""
 
+    device_class: SensorDeviceClass | None
+    native_unit_of_measurement: str | None
+    format_value: ValueFormatter
 
-def get_api_response_value_as_state(
-    entity: SensorEntity,
-    value: ApiResponseValue | None,
-) -> StateType:
+
+class RenderedSensorEntity(Protocol):
+    @cached_property
+    def render_plan(self) -> SensorRenderPlan: ...
+
+
+def compile_render_plan(
+    device_class: SensorDeviceClass | None, native_unit_of_measurement: str | None
+) -> SensorRenderPlan:
+    if device_class is None and native_unit_of_measurement:
+        device_class = guess_device_class_from_unit(native_unit_of_measurement)
+
+    return SensorRenderPlan(
+        device_class=device_class,
+        native_unit_of_measurement=native_unit_of_measurement,
+        format_value=VALUE_FORMATTERS_BY_UNIT.get(
+            native_unit_of_measurement, format_numeric_value
+        ),
+    )
+
+
+def format_other_value(value: ApiResponseValue | None) -> StateType:
     if isinstance(value, bytes):
         return value.hex()
 
     if isinstance(value, tuple):
         return None
 
-    if isinstance(value, (int, float)) and entity.native_unit_of_measurement == "%":
+    return value
+
+
+def format_numeric_value(value: ApiResponseValue | None) -> StateType:
+    if isinstance(value, int | float):
+        return round(value, NUMERIC_STATE_DECIMAL_DIGITS)
+
+    return format_other_value(value)
+
+
+def format_percent_value(value: ApiResponseValue | None) -> StateType:
+    if isinstance(value, int | float):
         return round(value * 100, NUMERIC_STATE_DECIMAL_DIGITS)
 
-    if isinstance(value, (int, float)) and entity.native_unit_of_measurement == "Hz":
+    return format_other_value(value)
+
+
+def format_frequency_value(value: ApiResponseValue | None) -> StateType:
+    if isinstance(value, int | float):
         return round(value, FREQUENCY_STATE_DECIMAL_DIGITS)
 
-    if isinstance(value, (int, float)):
-        return round(value, NUMERIC_STATE_DECIMAL_DIGITS)
+    return format_other_value(value)
 
-    return value
+
+VALUE_FORMATTERS_BY_UNIT: dict[str | None, ValueFormatter] = {
+    "%": format_percent_value,
+    "Hz": format_frequency_value,
+}
+
+
+def get_first_api_response_value_as_state(
+    entity: RenderedSensorEntity,
+    values: list[ApiResponseValue | None],
+) -> StateType:
+    if len(values) <= 0:
+        return None
+
+    return entity.render_plan.format_value(values[0])
+
+
+def get_api_response_value_as_state(
+    entity: RenderedSensorEntity,
+    value: ApiResponseValue | None,
+) -> StateType:
+    return entity.render_plan.format_value(value)
 
 
 def get_first_api_response_value_as_absolute_state(
-    entity: SensorEntity,
+    entity: RenderedSensorEntity,
     values: list[ApiResponseValue | None],
 ) -> StateType:
     value = get_first_api_response_value_as_state(entity=entity, values=values)
@@ -60,7 +115,7 @@ def get_first_api_response_value_as_absolute_state(
 
 
 def sum_api_response_values_as_state(
-    entity: SensorEntity,
+    entity: RenderedSensorEntity,
     values: list[ApiResponseValue | None],
 ) -> float:
     return sum(
@@ -68,7 +123,7 @@ def sum_api_response_values_as_state(
             float(state_value)
             for value in values
             if isinstance(
-                state_value := get_api_response_value_as_state(entity, value),
+                state_value := entity.render_plan.format_value(value),
                 (int, float),
             )
         ),
@@ -0,0 +1,30 @@
+"""Test the state helpers."""
+
+from __future__ import annotations
+
+from homeassistant.components.sensor import SensorDeviceClass
+
+from .state_helpers import compile_render_plan
+
+
+def test_compile_render_plan() -> None:
+    """Test that the plan guesses the device class and formats by unit."""
+    plan = compile_render_plan(None, "W")
+    assert plan.device_class == SensorDeviceClass.POWER
+    assert plan.format_value(1234.5678) == 1234.6
+    assert plan.format_value(b"\x01\xff") == "01ff"
+    assert plan.format_value(None) is None
+
+    plan = compile_render_plan(None, "%")
+    assert plan.device_class is None
+    assert plan.format_value(0.5) == 50.0
+
+    plan = compile_render_plan(SensorDeviceClass.FREQUENCY, "Hz")
+    assert plan.device_class == SensorDeviceClass.FREQUENCY
+    assert plan.format_value(50.01234) == 50.012
+
+
+def test_keep_device_class_of_description() -> None:
+    """Test that a device class set by the description isn't guessed."""
+    plan = compile_render_plan(SensorDeviceClass.APPARENT_POWER, "VA")
+    assert plan.device_class == SensorDeviceClass.APPARENT_POWER
@@ -8,7 +8,20 @@ class RctConfEntryData(TypedDict):
     port: int
 
 
+class RctDeadbandOptions(TypedDict, total=False):
+    absolute: float | None
+    relative: float | None
+    max_silence: int
+
+
 class RctConfEntryOptions(TypedDict, total=False):
     frequent_scan_interval: int
     infrequent_scan_interval: int
     static_scan_interval: int
+    state_heartbeat_interval: int
+    deadbands: dict[str, RctDeadbandOptions]
+    adaptive_polling: bool
+    adaptive_min_scan_interval: int
+    adaptive_max_scan_interval: int
+    adaptive_power_rate_threshold: float
+    adaptive_current_rate_threshold: float
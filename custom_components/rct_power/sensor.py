@@ -9,11 +9,18 @@ from homeassistant.helpers.entity import Entity
 
 from . import RctConfigEntry
 from .lib.entities import (
-    battery_sensor_entity_descriptions,
-    bitfield_sensor_entity_descriptions,
-    inverter_sensor_entity_descriptions,
+    get_battery_sensor_entity_descriptions,
+    get_bitfield_sensor_entity_descriptions,
+    get_inverter_sensor_entity_descriptions,
+    get_poll_metrics_sensor_entity_descriptions,
+)
+from .lib.entity import (
+    RctPowerBitfieldSensorEntity,
+    RctPowerEntityDescription,
+    RctPowerPollMetricsSensorEntity,
+    RctPowerSensorEntity,
+    resolve_object_infos,
 )
-from .lib.entity import RctPowerBitfieldSensorEntity, RctPowerSensorEntity
 
 
 async def async_setup_entry(
@@ -24,13 +31,20 @@ async def async_setup_entry(
     """Setup sensor platform."""
     data = entry.runtime_data
 
+    def is_supported(entity_description: RctPowerEntityDescription) -> bool:
+        return all(
+            object_info.object_id not in data.unsupported_object_ids
+            for object_info in resolve_object_infos(entity_description)
+        )
+
     battery_sensor_entities = [
         RctPowerSensorEntity(
             coordinators=list(data.update_coordinators.values()),
             config_entry=entry,
             entity_description=entity_description,
         )
-        for entity_description in battery_sensor_entity_descriptions
+        for entity_description in get_battery_sensor_entity_descriptions()
+        if is_supported(entity_description)
     ]
 
     inverter_sensor_entities = [
@@ -39,7 +53,8 @@ async def async_setup_entry(
             config_entry=entry,
             entity_description=entity_description,
         )
-        for entity_description in inverter_sensor_entity_descriptions
+        for entity_description in get_inverter_sensor_entity_descriptions()
+        if is_supported(entity_description)
     ]
 
     bitfield_sensor_entities = [
@@ -48,7 +63,17 @@ async def async_setup_entry(
             config_entry=entry,
             entity_description=entity_description,
         )
-        for entity_description in bitfield_sensor_entity_descriptions
+        for entity_description in get_bitfield_sensor_entity_descriptions()
+        if is_supported(entity_description)
+    ]
+
+    poll_metrics_sensor_entities = [
+        RctPowerPollMetricsSensorEntity(
+            scheduler=data.scheduler,
+            config_entry=entry,
+            entity_description=entity_description,
+        )
+        for entity_description in get_poll_metrics_sensor_entity_descriptions()
     ]
 
     async_add_entities(
@@ -56,5 +81,6 @@ async def async_setup_entry(
             *battery_sensor_entities,
             *inverter_sensor_entities,
             *bitfield_sensor_entities,
+            *poll_metrics_sensor_entities,
         ]
     )
@@ -0,0 +1,96 @@
+"""Persist the latest responses, so entities have their values right after a restart."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TypedDict
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .lib.api import RctPowerData, ValidApiResponse
+
+STORAGE_VERSION = 1
+
+# the snapshot is written at most this often in seconds while polling, and
+# when Home Assistant stops or the entry is unloaded
+SNAPSHOT_SAVE_DELAY = 60 * 10
+
+
+class SnapshotResponse(TypedDict):
+    value: bool | int | float | str
+    # local time of the request, as in ValidApiResponse
+    time: str
+
+
+class ResponseSnapshot(TypedDict):
+    # by the object ids in hex, as JSON only supports string keys
+    responses: dict[str, SnapshotResponse]
+
+
+class RctPowerSnapshotStore:
+    """Store the valid responses of an inverter in Home Assistant's storage."""
+
+    def __init__(self, hass: HomeAssistant, inverter_sn: str) -> None:
+        self._store = Store[ResponseSnapshot](
+            hass, STORAGE_VERSION, f"{DOMAIN}.snapshot.{inverter_sn}"
+        )
+        self._save_scheduled = False
+        # set once the entry is unloaded, after which nothing is saved anymore
+        self._closed = False
+
+    async def async_load(self) -> RctPowerData:
+        if (snapshot := await self._store.async_load()) is None:
+            return {}
+
+        responses: RctPowerData = {}
+
+        for object_id_hex, response in snapshot["responses"].items():
+            object_id = int(object_id_hex, 16)
+            responses[object_id] = ValidApiResponse(
+                object_id=object_id,
+                time=datetime.fromisoformat(response["time"]),
+                value=response["value"],
+            )
+
+        return responses
+
+    @callback
+    def async_schedule_save(self, responses: RctPowerData) -> None:
+        """Save the responses, which may change until then, after a delay."""
+        # further calls don't postpone the pending save, unlike Store's own
+        # delayed saves, so the snapshot is written periodically while polling
+        if self._save_scheduled or self._closed:
+            return
+
+        self._save_scheduled = True
+        self._store.async_delay_save(
+            lambda: self._build_snapshot(responses), SNAPSHOT_SAVE_DELAY
+        )
+
+    async def async_close(self, responses: RctPowerData) -> None:
+        """Save the responses right away, instead of the scheduled save, on unload."""
+        # the listeners of the entry are only removed after unloading, so
+        # saves they schedule until then would write after a removal
+        self._closed = True
+        # replaces the data of a scheduled save and cancels its timer
+        await self._store.async_save(self._build_snapshot(responses))
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    def _build_snapshot(self, responses: RctPowerData) -> ResponseSnapshot:
+        self._save_scheduled = False
+
+        # only plain values are kept, time series and event logs are read again
+        return ResponseSnapshot(
+            responses={
+                f"{object_id:x}": SnapshotResponse(
+                    value=response.value, time=response.time.isoformat()
+                )
+                for object_id, response in responses.items()
+                if isinstance(response, ValidApiResponse)
+                and isinstance(response.value, bool | int | float | str)
+            }
+        )
@@ -0,0 +1,104 @@
+"""Test the warm start from a snapshot of the latest responses."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from rctclient.registry import REGISTRY
+
+from custom_components.rct_power.const import DOMAIN, ConfScanInterval
+from custom_components.rct_power.snapshot import SNAPSHOT_SAVE_DELAY
+from tests.common import FakeClock, async_setup_simulator_entry
+from tests.simulator import InverterSimulator
+
+INVERTER_SN = "0123456789"
+STORAGE_KEY = f"{DOMAIN}.snapshot.{INVERTER_SN}"
+INVERTER_SN_OID = REGISTRY.get_by_name("inverter_sn").object_id
+BATTERY_SOC_OID = REGISTRY.get_by_name("battery.soc").object_id
+BATTERY_SOH_OID = REGISTRY.get_by_name("battery.soh").object_id
+OPTIONS: dict[str, Any] = {
+    ConfScanInterval.FREQUENT: 30,
+    ConfScanInterval.INFREQUENT: 90,
+    ConfScanInterval.STATIC: 3600,
+}
+
+
+async def test_restore_snapshot(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    clock: FakeClock,
+    inverter_simulator: InverterSimulator,
+) -> None:
+    """Test that fresh responses of the snapshot are used right after setup."""
+    inverter_simulator.set_value("inverter_sn", INVERTER_SN)
+    config_entry = await async_setup_simulator_entry(
+        hass, inverter_simulator, options=OPTIONS, unique_id=INVERTER_SN
+    )
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    snapshot = hass_storage[STORAGE_KEY]["data"]["responses"]
+    assert snapshot[f"{INVERTER_SN_OID:x}"]["value"] == INVERTER_SN
+    # the state of charge is only fresh for the frequent interval
+    time = datetime.fromisoformat(snapshot[f"{BATTERY_SOC_OID:x}"]["time"])
+    snapshot[f"{BATTERY_SOC_OID:x}"]["time"] = (time - timedelta(minutes=1)).isoformat()
+    inverter_simulator.requested_object_ids.clear()
+
+    with patch(
+        "custom_components.rct_power.async_read_remaining_objects",
+        new=AsyncMock(),
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    # the devices are known without reading anything
+    assert not inverter_simulator.requested_object_ids
+    scheduler = config_entry.runtime_data.scheduler
+    assert INVERTER_SN_OID in scheduler.responses
+    assert BATTERY_SOH_OID in scheduler.responses
+    assert BATTERY_SOC_OID not in scheduler.responses
+    state = hass.states.get("sensor.rct_power_storage_inverter_serial_number")
+    assert state is not None
+    assert state.state == INVERTER_SN
+
+    # the live refresh reads stale objects and the restored device objects
+    await scheduler.async_refresh()
+    assert BATTERY_SOC_OID in inverter_simulator.requested_object_ids
+    assert INVERTER_SN_OID in inverter_simulator.requested_object_ids
+    assert BATTERY_SOH_OID not in inverter_simulator.requested_object_ids
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_remove_snapshot_with_entry(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    clock: FakeClock,
+    inverter_simulator: InverterSimulator,
+) -> None:
+    """Test that the snapshot is removed along with the entry and not saved again."""
+    inverter_simulator.set_value("inverter_sn", INVERTER_SN)
+    config_entry = await async_setup_simulator_entry(
+        hass, inverter_simulator, options=OPTIONS, unique_id=INVERTER_SN
+    )
+    data = config_entry.runtime_data
+    assert data.snapshot_store is not None
+
+    await hass.config_entries.async_remove(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert STORAGE_KEY not in hass_storage
+
+    # like a listener of the entry before it's removed from the scheduler
+    data.snapshot_store.async_schedule_save(data.scheduler.responses)
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SNAPSHOT_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert STORAGE_KEY not in hass_storage
@@ -0,0 +1,427 @@
+"""Benchmark the poll path of the API client against the local inverter simulator.
+
+The import suite measures the imports of the integration in fresh interpreters,
+as they add to the boot time of Home Assistant. The render suite measures the
+properties Home Assistant reads from every sensor when it writes its state.
+
+Run it from the repository root with `python -m tests.benchmark`. Use `--save`
+to store the results as a baseline and `--compare` to fail when the results
+regress beyond `--threshold` compared to a stored baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from rctclient.registry import REGISTRY
+
+from custom_components.rct_power import object_ids_for_update_priority
+from custom_components.rct_power.const import CONF_ENTITY_PREFIX, EntityUpdatePriority
+from custom_components.rct_power.lib.api import (
+    RctPowerApiClient,
+    RctPowerData,
+    ValidApiResponse,
+)
+from custom_components.rct_power.lib.entities import (
+    get_battery_sensor_entity_descriptions,
+    get_bitfield_sensor_entity_descriptions,
+    get_inverter_sensor_entity_descriptions,
+)
+from custom_components.rct_power.lib.entity import (
+    RctPowerBitfieldSensorEntity,
+    RctPowerSensorEntity,
+)
+from tests.simulator import InverterSimulator
+
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "benchmark_baseline.json"
+DEFAULT_POLLS = 50
+DEFAULT_LATENCY = 0.005
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_IMPORT_RUNS = 5
+DEFAULT_RENDER_ROUNDS = 1000
+
+# imported before the measurements, as Home Assistant has loaded them long
+# before it sets up the integration
+IMPORT_PRELOADED_MODULES = [
+    "voluptuous",
+    "homeassistant.components.sensor",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+]
+# measured in this order, so each one excludes the modules before it
+IMPORT_MODULES = [
+    "rctclient.registry",
+    "custom_components.rct_power",
+]
+IMPORT_SCRIPT = """
+import importlib, json, sys, time
+
+preloaded_modules, modules = json.loads(sys.argv[1])
+for module in preloaded_modules:
+    importlib.import_module(module)
+
+durations = {}
+for module in modules:
+    start = time.perf_counter()
+    importlib.import_module(module)
+    durations[module] = time.perf_counter() - start
+
+# the poll plan is built on the first setup of an entry
+from custom_components.rct_power import get_poll_plan
+
+start = time.perf_counter()
+get_poll_plan()
+durations["poll_plan"] = time.perf_counter() - start
+
+print(json.dumps(durations))
+"""
+
+# metrics for which a higher value is an improvement
+HIGHER_IS_BETTER = {"objects_per_second"}
+# metrics that describe the workload instead of its cost
+INFORMATIONAL = {"objects", "entities"}
+
+type BenchmarkResults = dict[str, dict[str, dict[str, float]]]
+
+
+@dataclass
+class PollBenchmarkResult:
+    objects: int
+    latency_p50: float
+    latency_p95: float
+    latency_p99: float
+    objects_per_second: float
+    cpu_per_object: float
+    peak_memory: float
+    # still allocated after the poll, like the responses
+    retained_memory: float
+    round_trips: float
+
+
+@dataclass
+class ImportBenchmarkResult:
+    duration_p50: float
+    duration_min: float
+
+
+@dataclass
+class RenderBenchmarkResult:
+    entities: int
+    # the state, unit and device class of each entity
+    duration_per_entity: float
+
+
+async def async_benchmark_poll(
+    simulator: InverterSimulator, *, polls: int, latency: float
+) -> dict[str, PollBenchmarkResult]:
+    """Measure the polls of each update priority group."""
+    simulator.latency = latency
+    client = RctPowerApiClient(hostname=simulator.host, port=simulator.port)
+    results: dict[str, PollBenchmarkResult] = {}
+
+    try:
+        for update_priority in EntityUpdatePriority:
+            object_ids = object_ids_for_update_priority(update_priority)
+
+            # establish the connection outside of the measurements
+            await client.async_get_data(object_ids)
+
+            durations: list[float] = []
+            cpu_start = time.process_time()
+            for _ in range(polls):
+                start = time.perf_counter()
+                data = await client.async_get_data(object_ids)
+                durations.append(time.perf_counter() - start)
+
+                assert all(
+                    isinstance(response, ValidApiResponse) for response in data.values()
+                ), "The simulator didn't answer all requests"
+            cpu_time = time.process_time() - cpu_start
+
+            tracemalloc.start()
+            data = await client.async_get_data(object_ids)
+            retained_memory, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            percentiles = statistics.quantiles(durations, n=100, method="inclusive")
+            median_duration = statistics.median(durations)
+
+            results[update_priority.name] = PollBenchmarkResult(
+                objects=len(object_ids),
+                latency_p50=percentiles[49],
+                latency_p95=percentiles[94],
+                latency_p99=percentiles[98],
+                objects_per_second=len(object_ids) * polls / sum(durations),
+                cpu_per_object=cpu_time / (len(object_ids) * polls),
+                peak_memory=peak_memory,
+                retained_memory=retained_memory,
+                # every round trip costs at least the simulated latency
+                round_trips=round(median_duration / latency, 1) if latency else 0.0,
+            )
+    finally:
+        await client.async_close()
+
+    return results
+
+
+def benchmark_imports(*, runs: int) -> dict[str, ImportBenchmarkResult]:
+    """Measure the imports of the integration in fresh interpreters."""
+    durations: dict[str, list[float]] = {}
+
+    for _ in range(runs):
+        process = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                IMPORT_SCRIPT,
+                json.dumps([IMPORT_PRELOADED_MODULES, IMPORT_MODULES]),
+            ],
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).parent.parent,
+            text=True,
+        )
+
+        for group, duration in json.loads(process.stdout).items():
+            durations.setdefault(group, []).append(duration)
+
+    return {
+        group: ImportBenchmarkResult(
+            duration_p50=statistics.median(group_durations),
+            duration_min=min(group_durations),
+        )
+        for group, group_durations in durations.items()
+    }
+
+
+def create_render_entities() -> dict[str, list[RctPowerSensorEntity]]:
+    """Create the sensors of an entry, with the sample values of all objects."""
+    responses: RctPowerData = {}
+    # the entities only read the response index of the scheduler
+    coordinator: Any = SimpleNamespace(scheduler=SimpleNamespace(responses=responses))
+    config_entry: Any = SimpleNamespace(
+        entry_id="benchmark",
+        data={CONF_ENTITY_PREFIX: "RCT Power Storage"},
+        options={},
+    )
+    response_time = datetime.now()
+
+    entities: dict[str, list[RctPowerSensorEntity]] = {
+        "sensor": [
+            RctPowerSensorEntity([coordinator], config_entry, entity_description)
+            for entity_description in (
+                *get_battery_sensor_entity_descriptions(),
+                *get_inverter_sensor_entity_descriptions(),
+            )
+        ],
+        "bitfield": [
+            RctPowerBitfieldSensorEntity(
+                [coordinator], config_entry, entity_description
+            )
+            for entity_description in get_bitfield_sensor_entity_descriptions()
+        ],
+    }
+
+    for group_entities in entities.values():
+        for entity in group_entities:
+            for object_info in entity.object_infos:
+                responses[object_info.object_id] = ValidApiResponse(
+                    object_id=object_info.object_id,
+                    time=response_time,
+                    value=REGISTRY.get_by_id(object_info.object_id).sim_data,
+                )
+
+    return entities
+
+
+def benchmark_render(*, rounds: int) -> dict[str, RenderBenchmarkResult]:
+    """Measure the properties read from the sensors on every state write."""
+    results: dict[str, RenderBenchmarkResult] = {}
+
+    for group, entities in create_render_entities().items():
+        durations: list[float] = []
+
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for entity in entities:
+                entity.native_value  # noqa: B018
+                entity.native_unit_of_measurement  # noqa: B018
+                entity.device_class  # noqa: B018
+            durations.append(time.perf_counter() - start)
+
+        results[group] = RenderBenchmarkResult(
+            entities=len(entities),
+            duration_per_entity=statistics.median(durations) / len(entities),
+        )
+
+    return results
+
+
+async def async_run_benchmarks(*, polls: int, latency: float) -> BenchmarkResults:
+    simulator = InverterSimulator()
+    await simulator.async_start()
+
+    try:
+        poll_results = await async_benchmark_poll(
+            simulator, polls=polls, latency=latency
+        )
+    finally:
+        await simulator.async_stop()
+
+    return {
+        "poll": {group: asdict(result) for group, result in poll_results.items()},
+    }
+
+
+def find_regressions(
+    baseline: BenchmarkResults,
+    results: BenchmarkResults,
+    threshold: float,
+    metrics: set[str] | None = None,
+) -> list[str]:
+    """List all metrics that are worse than the baseline by more than threshold."""
+    regressions: list[str] = []
+
+    for suite, groups in baseline.items():
+        for group, baseline_metrics in groups.items():
+            for metric, baseline_value in baseline_metrics.items():
+                value = results.get(suite, {}).get(group, {}).get(metric)
+
+                if (
+                    value is None
+                    or baseline_value == 0
+                    or metric in INFORMATIONAL
+                    or (metrics is not None and metric not in metrics)
+                ):
+                    continue
+
+                if metric in HIGHER_IS_BETTER:
+                    regressed = value < baseline_value * (1 - threshold)
+                else:
+                    regressed = value > baseline_value * (1 + threshold)
+
+                if regressed:
+                    regressions.append(
+                        f"{suite} {group} {metric}: {value:.6g} (baseline {baseline_value:.6g})"
+                    )
+
+    return regressions
+
+
+def format_results(results: BenchmarkResults) -> str:
+    lines: list[str] = []
+    metric_names = [
+        field.name
+        for result_type in (
+            PollBenchmarkResult,
+            ImportBenchmarkResult,
+            RenderBenchmarkResult,
+        )
+        for field in fields(result_type)
+    ]
+
+    for suite, groups in results.items():
+        lines.append(f"{suite}:")
+        for group, metrics in groups.items():
+            lines.append(f"  {group}:")
+            lines.extend(
+                f"    {metric}: {metrics[metric]:.6g}"
+                for metric in metric_names
+                if metric in metrics
+            )
+
+    return "\n".join(lines)
+
+
+def load_results(path: Path) -> BenchmarkResults:
+    data: Any = json.loads(path.read_text())
+    return data
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmark", description=__doc__
+    )
+    parser.add_argument("--polls", type=int, default=DEFAULT_POLLS)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=DEFAULT_LATENCY,
+        help="simulated response latency in seconds",
+    )
+    parser.add_argument(
+        "--import-runs",
+        type=int,
+        default=DEFAULT_IMPORT_RUNS,
+        help="number of fresh interpreters to measure the imports in",
+    )
+    parser.add_argument(
+        "--render-rounds",
+        type=int,
+        default=DEFAULT_RENDER_ROUNDS,
+        help="number of times to render all sensors",
+    )
+    parser.add_argument(
+        "--save",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_BASELINE_PATH,
+        help="store the results as baseline",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_BASELINE_PATH,
+        help="compare the results to a stored baseline",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="relative change of a metric that counts as regression",
+    )
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(async_run_benchmarks(polls=args.polls, latency=args.latency))
+    results["import"] = {
+        group: asdict(result)
+        for group, result in benchmark_imports(runs=args.import_runs).items()
+    }
+    results["render"] = {
+        group: asdict(result)
+        for group, result in benchmark_render(rounds=args.render_rounds).items()
+    }
+    print(format_results(results))
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2) + "\n")
+
+    if args.compare:
+        regressions = find_regressions(
+            load_results(args.compare), results, args.threshold
+        )
+
+        if regressions:
+            print("\nRegressions:")
+            print("\n".join(f"  {regression}" for regression in regressions))
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
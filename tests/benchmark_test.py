@@ -0,0 +1,82 @@
+"""Guard the poll path against regressions measured by the benchmark suite."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from tests.benchmark import (
+    DEFAULT_BASELINE_PATH,
+    BenchmarkResults,
+    async_benchmark_poll,
+    find_regressions,
+    load_results,
+)
+from tests.simulator import InverterSimulator
+
+
+async def test_poll_round_trips(inverter_simulator: InverterSimulator) -> None:
+    """Test that a poll doesn't take more round trips than the baseline."""
+    poll_results = await async_benchmark_poll(inverter_simulator, polls=5, latency=0.01)
+    results: BenchmarkResults = {
+        "poll": {group: asdict(result) for group, result in poll_results.items()}
+    }
+
+    # wall time and cpu metrics depend too much on the machine running the
+    # tests, but the number of round trips doesn't
+    assert (
+        find_regressions(
+            load_results(DEFAULT_BASELINE_PATH),
+            results,
+            threshold=1.0,
+            metrics={"round_trips"},
+        )
+        == []
+    )
+
+
+def test_import_is_lazy() -> None:
+    """Test that importing the integration doesn't build its lookup tables."""
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import custom_components.rct_power as integration\n"
+            "from custom_components.rct_power.lib import api, entities\n"
+            "print(\n"
+            "    integration.get_poll_plan.cache_info().currsize,\n"
+            "    entities.get_all_entity_descriptions.cache_info().currsize,\n"
+            "    api.get_object_infos_by_name.cache_info().currsize,\n"
+            ")",
+        ],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parent.parent,
+        text=True,
+    )
+
+    assert process.stdout.split() == ["0", "0", "0"]
+
+
+def test_find_regressions() -> None:
+    """Test that only changes beyond the threshold count as regressions."""
+    baseline: BenchmarkResults = {
+        "poll": {
+            "FREQUENT": {"objects": 10, "latency_p50": 1.0, "objects_per_second": 100.0}
+        }
+    }
+    results: BenchmarkResults = {
+        "poll": {
+            "FREQUENT": {"objects": 20, "latency_p50": 1.1, "objects_per_second": 70.0}
+        }
+    }
+
+    assert find_regressions(baseline, results, threshold=0.2) == [
+        "poll FREQUENT objects_per_second: 70 (baseline 100)"
+    ]
+    assert find_regressions(baseline, results, threshold=0.05) == [
+        "poll FREQUENT latency_p50: 1.1 (baseline 1)",
+        "poll FREQUENT objects_per_second: 70 (baseline 100)",
+    ]
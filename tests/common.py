@@ -0,0 +1,56 @@
+"""Helpers shared by the tests of the RCT Power integration."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from homeassistant.const import CONF_PORT
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.rct_power import RctConfigEntry
+from custom_components.rct_power.const import (
+    CONF_ENTITY_PREFIX,
+    CONF_HOSTNAME,
+    DEFAULT_ENTITY_PREFIX,
+    DOMAIN,
+)
+from tests.simulator import InverterSimulator
+
+
+class FakeClock:
+    """Monotonic clock that only advances when told to."""
+
+    def __init__(self) -> None:
+        self.time = 1000.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+async def async_setup_simulator_entry(
+    hass: HomeAssistant,
+    inverter_simulator: InverterSimulator,
+    options: Mapping[str, Any] | None = None,
+    unique_id: str | None = None,
+) -> RctConfigEntry:
+    """Set up a config entry connected to the inverter simulator."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_HOSTNAME: inverter_simulator.host,
+            CONF_PORT: inverter_simulator.port,
+            CONF_ENTITY_PREFIX: DEFAULT_ENTITY_PREFIX,
+        },
+        options=dict(options or {}),
+        entry_id="test",
+        unique_id=unique_id,
+    )
+    config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    # the objects not needed to register the devices are read in the background
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    return config_entry
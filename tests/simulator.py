@@ -0,0 +1,243 @@
+"""Local stand-in for an RCT Power inverter, speaking the RCT protocol over TCP."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from asyncio import Server, StreamReader, StreamWriter, TimerHandle
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from typing import cast
+
+from rctclient.frame import START_TOKEN
+from rctclient.registry import REGISTRY
+from rctclient.types import Command
+from rctclient.utils import encode_value
+
+from custom_components.rct_power.lib.api import ApiResponseValue
+from custom_components.rct_power.lib.frame_reader import (
+    READ_CHUNK_SIZE,
+    FrameDecoder,
+    crc16,
+)
+
+SIMULATOR_HOST = "127.0.0.1"
+# longer payloads need a LONG_RESPONSE with a two byte length field
+MAX_RESPONSE_DATA_LENGTH = 0xFF
+
+
+def encode_response_frame(
+    object_id: int, payload: bytes, *, corrupt_crc: bool = False
+) -> bytes:
+    """Encode a response frame like rctclient's make_frame does."""
+    data_length = len(payload) + 4
+
+    if data_length > MAX_RESPONSE_DATA_LENGTH:
+        body = bytes([Command.LONG_RESPONSE]) + data_length.to_bytes(2)
+    else:
+        body = bytes([Command.RESPONSE]) + data_length.to_bytes(1)
+
+    body += object_id.to_bytes(4) + payload
+    crc = crc16(body) ^ (0x0001 if corrupt_crc else 0x0000)
+    body += crc.to_bytes(2)
+
+    return START_TOKEN + body.replace(b"-", b"--").replace(b"+", b"-+")
+
+
+class InverterSimulator:
+    """Serve object values over the RCT protocol with injectable faults.
+
+    Values default to the simulation data of rctclient's registry and can be
+    overridden by object name. All fault injection settings are plain
+    attributes, so they can be changed while the simulator is running:
+
+    - latency, jitter: delay of each response in seconds, a jitter leads to
+      responses arriving out of order
+    - drop_rate: share of requests that are not answered at all
+    - crc_error_rate: share of responses sent with a wrong checksum
+    - unsolicited_rate: share of responses followed by an additional frame for
+      a previously requested object, like answers to other clients
+    - max_connections: number of concurrent connections before further ones
+      are closed right away
+    """
+
+    def __init__(
+        self,
+        *,
+        values: Mapping[str, ApiResponseValue] | None = None,
+        unsupported_object_names: Iterable[str] = (),
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        drop_rate: float = 0.0,
+        crc_error_rate: float = 0.0,
+        unsolicited_rate: float = 0.0,
+        max_connections: int | None = None,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.crc_error_rate = crc_error_rate
+        self.unsolicited_rate = unsolicited_rate
+        self.max_connections = max_connections
+
+        self.connections = 0
+        self.rejected_connections = 0
+        self.requests = 0
+        self.responses = 0
+        self.dropped_responses = 0
+        self.requested_object_ids: Counter[int] = Counter()
+
+        self._values: dict[int, ApiResponseValue] = {}
+        self._unsupported_object_ids = {
+            REGISTRY.get_by_name(object_name).object_id
+            for object_name in unsupported_object_names
+        }
+        self._random = random.Random(seed)
+        self._server: Server | None = None
+        self._writers: set[StreamWriter] = set()
+        self._scheduled_writes: set[TimerHandle] = set()
+
+        for object_name, value in (values or {}).items():
+            self.set_value(object_name, value)
+
+    @property
+    def host(self) -> str:
+        return SIMULATOR_HOST
+
+    @property
+    def port(self) -> int:
+        assert self._server is not None, "The simulator is not running"
+        return self._server.sockets[0].getsockname()[1]
+
+    @property
+    def active_connections(self) -> int:
+        return len(self._writers)
+
+    def set_value(self, object_name: str, value: ApiResponseValue) -> None:
+        self._values[REGISTRY.get_by_name(object_name).object_id] = value
+
+    def set_supported(self, object_name: str, supported: bool) -> None:
+        object_id = REGISTRY.get_by_name(object_name).object_id
+
+        if supported:
+            self._unsupported_object_ids.discard(object_id)
+        else:
+            self._unsupported_object_ids.add(object_id)
+
+    async def async_start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle_connection, host=SIMULATOR_HOST, port=0
+        )
+
+    async def async_stop(self) -> None:
+        for handle in self._scheduled_writes:
+            handle.cancel()
+        self._scheduled_writes.clear()
+
+        if self._server is not None:
+            self._server.close()
+            self.disconnect_all()
+            await self._server.wait_closed()
+            self._server = None
+
+    def disconnect_all(self) -> None:
+        """Close all client connections, like a restarting inverter would."""
+        for writer in list(self._writers):
+            writer.close()
+
+    def send_unsolicited(self, object_name: str) -> None:
+        """Send a response frame to all clients without a request."""
+        object_id = REGISTRY.get_by_name(object_name).object_id
+
+        if (frame := self._encode_value(object_id)) is not None:
+            self.send_frame(frame)
+
+    def send_frame(self, frame: bytes) -> None:
+        """Send an encoded frame to all clients, like one for an unknown object."""
+        for writer in self._writers:
+            writer.write(frame)
+
+    async def _handle_connection(
+        self, reader: StreamReader, writer: StreamWriter
+    ) -> None:
+        if (
+            self.max_connections is not None
+            and len(self._writers) >= self.max_connections
+        ):
+            self.rejected_connections += 1
+            writer.close()
+            return
+
+        self.connections += 1
+        self._writers.add(writer)
+        decoder = FrameDecoder()
+
+        try:
+            while chunk := await reader.read(READ_CHUNK_SIZE):
+                decoder.feed(chunk)
+
+                while (frame := decoder.next_frame()) is not None:
+                    if frame.command == Command.READ and frame.crc_ok:
+                        self._respond(writer, frame.id)
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    def _respond(self, writer: StreamWriter, object_id: int) -> None:
+        self.requests += 1
+        self.requested_object_ids[object_id] += 1
+
+        if (
+            object_id in self._unsupported_object_ids
+            or self._random.random() < self.drop_rate
+            or (
+                frame := self._encode_value(
+                    object_id,
+                    corrupt_crc=self._random.random() < self.crc_error_rate,
+                )
+            )
+            is None
+        ):
+            self.dropped_responses += 1
+            return
+
+        if self._random.random() < self.unsolicited_rate:
+            unsolicited_object_id = self._random.choice(list(self.requested_object_ids))
+            frame += self._encode_value(unsolicited_object_id) or b""
+
+        self.responses += 1
+        delay = self.latency + self._random.uniform(0, self.jitter)
+
+        if delay > 0:
+            self._schedule_write(writer, frame, delay)
+        else:
+            writer.write(frame)
+
+    def _schedule_write(self, writer: StreamWriter, frame: bytes, delay: float) -> None:
+        def write() -> None:
+            self._scheduled_writes.discard(handle)
+
+            if not writer.is_closing():
+                writer.write(frame)
+
+        handle = asyncio.get_running_loop().call_later(delay, write)
+        self._scheduled_writes.add(handle)
+
+    def _encode_value(
+        self, object_id: int, *, corrupt_crc: bool = False
+    ) -> bytes | None:
+        try:
+            object_info = REGISTRY.get_by_id(object_id)
+            value = self._values.get(object_id, object_info.sim_data)
+            payload = cast(
+                bytes,
+                encode_value(object_info.response_data_type, value),  # type: ignore
+            )
+        except Exception:
+            # unknown objects and values of unsupported types aren't answered
+            return None
+
+        return encode_response_frame(object_id, payload, corrupt_crc=corrupt_crc)